@@ -1,12 +1,24 @@
 import os
-import io
-import csv
-import random
+import struct
 import getpass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from collections import deque
+from contextlib import ExitStack, contextmanager
 from datetime import datetime, timedelta, timezone
+from decimal import Decimal
 
+import numpy as np
 import psycopg
-from psycopg.rows import dict_row
+import pyarrow as pa
+import pyarrow.parquet as pq
+from psycopg.rows import dict_row, scalar_row, tuple_row
+from psycopg.conninfo import conninfo_to_dict
+from psycopg.copy import QueuedLibpqWriter
+from psycopg.sql import SQL, Identifier, Literal
+from psycopg.types import TypeInfo
+from psycopg.types.datetime import DatetimeBinaryDumper
+from psycopg.types.numeric import NumericBinaryDumper
+from psycopg.types.string import StrBinaryDumper
 
 
 SCHEMA = "oltp"
@@ -15,7 +27,8 @@ SCHEMA = "oltp"
 SEED = 123
 
 # DSN composition
-# - If PG_DSN is provided, it is used as-is.
+# - If PG_DSN is provided, it is used as-is (any `options` in it, or PGOPTIONS, are merged
+#   with SESSION_OPTIONS by pg_connect).
 # - Otherwise, build a DSN using environment variables and default to the OS username
 #   (e.g., "spasumarthi" from the local machine account).
 os_user = getpass.getuser()
@@ -33,6 +46,17 @@ dsn = os.getenv(
 # When True, the script truncates all OLTP tables and restarts identities.
 RESET_DB_BEFORE_LOAD = False
 
+# When True (and RESET_DB_BEFORE_LOAD), the orders tables are loaded UNLOGGED and switched
+# back to LOGGED afterwards. Pays off with wal_level=minimal or slow WAL storage; with
+# wal_level=replica SET LOGGED re-writes every table to WAL, so it is off by default.
+LOAD_ORDERS_UNLOGGED = False
+
+# When True (and RESET_DB_BEFORE_LOAD, so identities restart at 1), the static dimension
+# tables in BRONZE_DIRECT_TABLES are also written to bronze Parquet straight from the
+# generated rows. postgres_to_duckdb.py reads both settings from here and skips them.
+BRONZE_DIRECT = False
+BRONZE_DIR = "food_delivery_dbt/data/bronze"
+
 # Scale parameters
 N_CUSTOMERS = 10000
 N_BRANDS = 60
@@ -44,8 +68,33 @@ N_ORDERS = 200000
 # FX generation window (daily ticks)
 FX_DAYS = 120
 
-# COPY buffering size
-CHUNK_ROWS = 50000
+# Orders per generated shard; at most 2 * ORDER_WORKERS shards are held in memory
+CHUNK_ROWS = 10000
+
+# Worker processes generating order shards (None -> os.cpu_count())
+ORDER_WORKERS = None
+
+# Restore script written by suspended_indexes before it drops anything. It is removed once
+# every index / constraint is back; if it is left behind, apply it with psql before the
+# next run (which refuses to start while it exists).
+SUSPENDED_DDL_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "suspended_ddl.sql")
+
+# Session memory for rebuilding indexes / validating constraints after the orders load
+MAINTENANCE_WORK_MEM = "2GB"
+
+# Parallel workers per CREATE INDEX when suspended_indexes rebuilds (capped server-side by
+# max_worker_processes / max_parallel_workers)
+MAINTENANCE_WORKERS = 4
+
+# Bulk load session settings, sent in the startup packet of every connection (libpq
+# `options`) instead of as SET round trips:
+# - commits don't wait for the WAL flush (a crash can only lose this synthetic load)
+# - index rebuilds get a large sort budget and parallel workers
+# - long COPYs / index builds are never cancelled by a server-side statement_timeout
+SESSION_OPTIONS = (
+    f"-c synchronous_commit=off -c maintenance_work_mem={MAINTENANCE_WORK_MEM} "
+    f"-c max_parallel_maintenance_workers={MAINTENANCE_WORKERS} -c statement_timeout=0"
+)
 
 # Orders time window
 ORDERS_DAYS = 90
@@ -74,6 +123,197 @@ VEHICLES = ["BIKE", "SCOOTER", "CAR"]
 REFUND_REASONS = ["LATE_DELIVERY", "MISSING_ITEM", "WRONG_ITEM", "QUALITY_ISSUE", "OTHER"]
 CATEGORIES = ["Burgers", "Pizza", "Indian", "Chinese", "Desserts", "Beverages", "Salads", "Snacks"]
 
+# Object arrays of the constants above. Generators sample integer indices and gather
+# from these, so picked values are the original Python str objects.
+PAYMENT_METHOD_VALUES = np.array(PAYMENT_METHODS, dtype=object)
+CANCELED_PAYMENT_STATUS_VALUES = np.array(["FAILED", "PENDING"], dtype=object)
+VEHICLE_VALUES = np.array(VEHICLES, dtype=object)
+REFUND_REASON_VALUES = np.array(REFUND_REASONS, dtype=object)
+CATEGORY_VALUES = np.array(CATEGORIES, dtype=object)
+COURIER_CITY_VALUES = np.array([c[0] for c in AU_CITIES + IN_CITIES], dtype=object)
+
+# Status events COPY'd per lifecycle: (timeline stage, order_status, actor_type).
+# PLACED events are derived from oltp.orders server-side (see populate_orders_related).
+DELIVERED_EVENTS = [
+    ("accepted", "ACCEPTED", "RESTAURANT"),
+    ("prep_start", "PREP_START", "RESTAURANT"),
+    ("ready", "READY_FOR_PICKUP", "RESTAURANT"),
+    ("picked_up", "PICKED_UP", "COURIER"),
+    ("delivered", "DELIVERED", "SYSTEM"),
+]
+CANCELED_EVENTS = [
+    ("canceled", "CANCELED", "SYSTEM"),
+]
+
+# Binary COPY layout of every table loaded with COPY: table -> (columns, Postgres types).
+# Binary COPY applies no casts, so each value is dumped as exactly the type listed here.
+REFERENCE_COPY_SPECS = {
+    "customers": (
+        ["full_name", "email", "phone", "created_at"],
+        ["text", "text", "text", "timestamptz"],
+    ),
+    "customer_addresses": (
+        [
+            "customer_id",
+            "label",
+            "line_1",
+            "line_2",
+            "city",
+            "state",
+            "country",
+            "postal_code",
+            "latitude",
+            "longitude",
+            "is_default",
+            "created_at",
+        ],
+        [
+            "int8",
+            "address_label",
+            "text",
+            "text",
+            "text",
+            "text",
+            "text",
+            "text",
+            "numeric",
+            "numeric",
+            "bool",
+            "timestamptz",
+        ],
+    ),
+    "restaurant_brands": (
+        ["brand_name", "is_active", "created_at"],
+        ["text", "bool", "timestamptz"],
+    ),
+    "restaurant_outlets": (
+        [
+            "brand_id",
+            "outlet_name",
+            "city",
+            "delivery_zone",
+            "address_line1",
+            "postal_code",
+            "is_active",
+            "created_at",
+        ],
+        ["int8", "text", "text", "text", "text", "text", "bool", "timestamptz"],
+    ),
+    "menu_items": (
+        ["restaurant_id", "item_name", "category", "price", "is_available", "created_at"],
+        ["int8", "text", "text", "numeric", "bool", "timestamptz"],
+    ),
+    "couriers": (
+        ["city", "vehicle", "is_active", "created_at"],
+        ["text", "vehicle_type", "bool", "timestamptz"],
+    ),
+    "fx_rates": (
+        ["base_currency_id", "quote_currency_id", "rate_ts", "rate", "source"],
+        ["int8", "int8", "timestamptz", "numeric", "text"],
+    ),
+}
+
+# Tables BRONZE_DIRECT writes to Parquet: table -> identity column prepended to its COPY
+# columns (the column order postgres_to_duckdb.py exports).
+BRONZE_DIRECT_TABLES = {
+    "customers": "customer_id",
+    "restaurant_brands": "brand_id",
+    "couriers": "courier_id",
+}
+
+# Arrow types for the COPY_SPECS types used by BRONZE_DIRECT_TABLES; enums become strings
+# and timestamptz is UTC-adjusted microseconds, as in the DuckDB export.
+ARROW_TYPES = {
+    "text": pa.string(),
+    "bool": pa.bool_(),
+    "timestamptz": pa.timestamp("us", tz="UTC"),
+    "vehicle_type": pa.string(),
+}
+
+# Tables bulk loaded by populate_orders_related (orders and its children), in the order
+# _gen_orders_chunk returns their rows.
+ORDER_COPY_SPECS = {
+    "orders": (
+        [
+            "order_id",
+            "customer_id",
+            "delivery_address_id",
+            "restaurant_id",
+            "order_placed_at",
+            "scheduled_delivery",
+            "subtotal",
+            "tax",
+            "delivery_fee",
+            "discount",
+            "total_amount",
+            "payment_method",
+            "payment_status",
+            "currency_id",
+        ],
+        [
+            "int8",
+            "int8",
+            "int8",
+            "int8",
+            "timestamptz",
+            "timestamptz",
+            "numeric",
+            "numeric",
+            "numeric",
+            "numeric",
+            "numeric",
+            "payment_method",
+            "payment_status",
+            "int8",
+        ],
+    ),
+    "order_items": (
+        ["order_id", "menu_item_id", "quantity", "unit_price", "line_total"],
+        ["int8", "int8", "int4", "numeric", "numeric"],
+    ),
+    "order_status_events": (
+        ["order_id", "event_ts", "status", "actor", "notes"],
+        ["int8", "timestamptz", "order_status", "actor_type", "text"],
+    ),
+    "delivery_assignments": (
+        ["order_id", "courier_id", "assigned_at", "pickup_eta", "dropoff_eta"],
+        ["int8", "int8", "timestamptz", "timestamptz", "timestamptz"],
+    ),
+    "refunds": (
+        ["order_id", "refund_ts", "refund_reason", "refund_amount", "currency_id"],
+        ["int8", "timestamptz", "refund_reason", "numeric", "int8"],
+    ),
+    "ratings": (
+        ["order_id", "customer_id", "restaurant_rating", "courier_rating", "comment", "created_at"],
+        ["int8", "int8", "int4", "int4", "text", "timestamptz"],
+    ),
+}
+ORDER_TABLES = list(ORDER_COPY_SPECS)
+COPY_SPECS = {**REFERENCE_COPY_SPECS, **ORDER_COPY_SPECS}
+
+# Every table written by this script; autovacuum is paused on these during the load.
+LOAD_TABLES = [
+    "customers",
+    "customer_addresses",
+    "restaurant_brands",
+    "restaurant_outlets",
+    "menu_items",
+    "couriers",
+    "currencies",
+    "fx_rates",
+] + ORDER_TABLES
+
+# OLTP enum types written through COPY (see oltp/schema.sql).
+ENUM_TYPES = [
+    "address_label",
+    "vehicle_type",
+    "payment_method",
+    "payment_status",
+    "order_status",
+    "actor_type",
+    "refund_reason",
+]
+
 
 def utc_now() -> datetime:
     """
@@ -87,54 +327,209 @@ def utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
-def qround(x: float, nd: int = 2) -> float:
+def to_datetimes(epoch_s) -> list[datetime]:
+    """
+    Convert an array of epoch seconds into UTC datetimes.
+
+    Generators sample timestamps as int64 epoch offsets with NumPy; datetime objects are
+    only built at the COPY boundary.
+    """
+    return [datetime.fromtimestamp(s, timezone.utc) for s in epoch_s.tolist()]
+
+
+# Seconds from the Unix epoch to the Postgres timestamp epoch (2000-01-01 UTC).
+PG_EPOCH_OFFSET_S = 946_684_800
+
+_pack_int8 = struct.Struct("!q").pack
+
+
+class FloatNumericBinaryDumper(NumericBinaryDumper):
+    """
+    Binary numeric dumper that also accepts floats.
+
+    Generators keep money/geo values as floats rounded with np.round. Binary COPY applies
+    no casts, so floats are converted to Decimal through their shortest string form.
+    """
+
+    def dump(self, obj):
+        if isinstance(obj, float):
+            obj = Decimal(str(obj))
+        return super().dump(obj)
+
+
+class EpochTimestamptzBinaryDumper(DatetimeBinaryDumper):
     """
-    Round a float with a tiny epsilon to stabilize binary floating-point artifacts.
+    Binary timestamptz dumper that also accepts int epoch seconds.
 
-    This helps avoid values like 12.0000000003 from causing check constraints to fail
-    when comparing computed totals after rounding.
+    The orders phase keeps timestamps as int64 epoch seconds end to end, so they are
+    written as Postgres microseconds directly instead of going through datetime objects.
     """
-    return float(round(x + 1e-12, nd))
 
+    def dump(self, obj):
+        if isinstance(obj, int):
+            return _pack_int8((obj - PG_EPOCH_OFFSET_S) * 1_000_000)
+        return super().dump(obj)
 
-def copy_rows(conn, table: str, columns: list[str], rows_iterable, schema_qualify: bool = True) -> None:
+
+def fetch_enum_types(conn) -> list[TypeInfo]:
+    """
+    Look up the OLTP enum types in ENUM_TYPES with a single pg_type query.
     """
-    Bulk load rows into Postgres using COPY FROM STDIN (CSV).
+    with conn.cursor(row_factory=tuple_row) as cur:
+        cur.execute(
+            """
+            SELECT t.typname, t.oid, t.typarray
+            FROM pg_type t
+            JOIN pg_namespace n ON n.oid = t.typnamespace
+            WHERE n.nspname = %s AND t.typname = ANY(%s)
+            """,
+            (SCHEMA, ENUM_TYPES),
+        )
+        return [TypeInfo(name, oid, array_oid) for name, oid, array_oid in cur.fetchall()]
+
+
+def register_copy_types(conn, enum_types: list[TypeInfo]) -> None:
+    """
+    Register the adapters needed by binary COPY on this connection.
+
+    - numeric columns accept the float values produced by the generators
+    - timestamptz columns accept int epoch seconds as well as datetimes
+    - OLTP enum types (see fetch_enum_types) are dumped from their str labels
+    """
+    conn.adapters.register_dumper(None, FloatNumericBinaryDumper)
+    conn.adapters.register_dumper(None, EpochTimestamptzBinaryDumper)
+
+    for info in enum_types:
+        info.register(conn)
+        dumper = type(f"{info.name}_binary_dumper", (StrBinaryDumper,), {"oid": info.oid})
+        conn.adapters.register_dumper(None, dumper)
+
+
+@contextmanager
+def copy_stream(cur, table: str, writer=None):
+    """
+    Open a binary COPY FROM STDIN into `table` on `cur` and yield the psycopg Copy object.
 
     Implementation notes:
-    - Generates CSV rows into an in-memory buffer (StringIO) and streams to Postgres.
-    - Uses \\N as the NULL sentinel to match Postgres COPY defaults for NULL in CSV mode.
-    - Flushes the buffer every CHUNK_ROWS rows to bound memory usage.
+    - Columns and their Postgres types (e.g. int8, numeric, timestamptz, payment_method)
+      come from COPY_SPECS[table]; rows must follow that column order.
+    - Rows are passed to write_row as-is; psycopg/libpq batch the COPY data messages.
+    - None is sent as NULL.
+    - Requires register_copy_types on the connection for numeric and enum columns.
     """
+    columns, types = COPY_SPECS[table]
     cols_sql = ", ".join([f'"{c}"' for c in columns])
 
-    # The staging table (_stg_orders) is a TEMP table without schema qualification.
-    if schema_qualify:
-        sql = f'COPY "{SCHEMA}"."{table}" ({cols_sql}) FROM STDIN WITH (FORMAT csv, NULL \'\\N\')'
-    else:
-        sql = f'COPY "{table}" ({cols_sql}) FROM STDIN WITH (FORMAT csv, NULL \'\\N\')'
+    sql = f'COPY "{SCHEMA}"."{table}" ({cols_sql}) FROM STDIN WITH (FORMAT BINARY)'
+
+    with cur.copy(sql, writer=writer) as cp:
+        cp.set_types(types)
+        yield cp
 
-    with conn.cursor() as cur:
-        with cur.copy(sql) as cp:
-            buf = io.StringIO()
-            writer = csv.writer(buf, lineterminator="\n")
 
-            buffered = 0
+def copy_rows(conn, table: str, rows_iterable) -> None:
+    """
+    Bulk load rows into Postgres using binary COPY FROM STDIN (see copy_stream).
+
+    Rows are encoded on the calling thread while QueuedLibpqWriter sends the buffers from
+    a background thread through a bounded queue, so generating the next rows overlaps
+    with network I/O and the queue caps the memory held in flight.
+    """
+    with conn.cursor() as cur:
+        with copy_stream(cur, table, writer=QueuedLibpqWriter(cur)) as cp:
             for row in rows_iterable:
-                # Convert None -> \N so Postgres COPY interprets it as NULL.
-                writer.writerow(["\\N" if v is None else v for v in row])
-                buffered += 1
+                cp.write_row(row)
+
+
+def copy_dimension_rows(conn, table: str, rows_iterable) -> dict:
+    """
+    COPY rows into a static dimension table (see copy_rows) and, with BRONZE_DIRECT, return
+    them as {table: pyarrow.Table} for write_bronze_parquet (otherwise {}).
+
+    After RESET_DB_BEFORE_LOAD restarts identities, the single COPY into the empty table
+    draws ids lo..hi in row order, so the Arrow table gets the same ids as Postgres.
+    """
+    if not BRONZE_DIRECT:
+        copy_rows(conn, table, rows_iterable)
+        return {}
+
+    rows = list(rows_iterable)
+    copy_rows(conn, table, rows)
+
+    id_column = BRONZE_DIRECT_TABLES[table]
+    id_rng = load_id_ranges(conn, [(table, id_column)])[table]
+    if id_rng["hi"] - id_rng["lo"] + 1 != len(rows):
+        raise ValueError(f"{table} was not empty before the load; cannot write it to bronze directly.")
+
+    columns, types = COPY_SPECS[table]
+    arrays = [pa.array(np.arange(id_rng["lo"], id_rng["hi"] + 1), pa.int64())]
+    arrays += [pa.array(values, ARROW_TYPES[t]) for values, t in zip(zip(*rows), types)]
+    return {table: pa.Table.from_arrays(arrays, names=[id_column, *columns])}
+
+
+def write_bronze_parquet(table: str, data: pa.Table) -> None:
+    """
+    Write a BRONZE_DIRECT table to `BRONZE_DIR/<table>.parquet` (ZSTD, 16k row groups, as
+    in postgres_to_duckdb.py).
+    """
+    os.makedirs(BRONZE_DIR, exist_ok=True)
+    pq.write_table(data, os.path.join(BRONZE_DIR, f"{table}.parquet"), compression="zstd", row_group_size=16384)
 
-                # Periodic flush prevents large memory spikes on big datasets.
-                if buffered >= CHUNK_ROWS:
-                    cp.write(buf.getvalue())
-                    buf.seek(0)
-                    buf.truncate(0)
-                    buffered = 0
 
-            # Flush any remaining buffered rows.
-            if buf.tell():
-                cp.write(buf.getvalue())
+def pg_connect(**kwargs):
+    """
+    Open a connection to `dsn` with SESSION_OPTIONS and TCP keepalives enabled.
+
+    Keepalives stop idle-looking sessions (e.g. the main connection while the orders
+    phase streams over the loader connections) from being dropped by middleboxes.
+
+    Passing `options` replaces the one from the DSN (or PGOPTIONS), so any user-supplied
+    options are appended after SESSION_OPTIONS and win for settings given in both.
+    """
+    user_options = conninfo_to_dict(dsn).get("options") or os.getenv("PGOPTIONS", "")
+    return psycopg.connect(
+        dsn,
+        options=f"{SESSION_OPTIONS} {user_options}".strip(),
+        keepalives=1,
+        keepalives_idle=30,
+        **kwargs,
+    )
+
+
+@contextmanager
+def loader_connections(names: list[str]):
+    """
+    Open one COPY connection per name and yield them as {name: connection}.
+
+    Each connection runs a single transaction for the whole block, so several tables
+    can be loaded concurrently in separate backends. If the block raises, every
+    connection is rolled back. On success they are committed one after another, so a
+    commit failing part way leaves the earlier connections' rows committed.
+
+    The enum types are looked up once, on the first connection, and registered on all.
+    """
+    loaders = {}
+    try:
+        enum_types = None
+        for name in names:
+            c = pg_connect(autocommit=False)
+            loaders[name] = c
+            if enum_types is None:
+                enum_types = fetch_enum_types(c)
+            register_copy_types(c, enum_types)
+
+        try:
+            yield loaders
+        except BaseException:
+            for c in loaders.values():
+                c.rollback()
+            raise
+
+        for c in loaders.values():
+            c.commit()
+    finally:
+        for c in loaders.values():
+            c.close()
 
 
 def reset_tables(conn) -> None:
@@ -165,6 +560,172 @@ def reset_tables(conn) -> None:
         cur.execute(sql)
 
 
+@contextmanager
+def autovacuum_suspended(conn, tables: list[str]):
+    """
+    Disable autovacuum on `tables` for a bulk load, then re-enable it and ANALYZE them.
+
+    Autovacuum would otherwise wake up repeatedly on tables that are only being appended
+    to. The reloption change is committed right away (it does not block COPY), and the
+    tables are analyzed once at the end so planner statistics reflect the loaded data.
+    """
+    with conn.cursor() as cur:
+        for t in tables:
+            cur.execute(f'ALTER TABLE "{SCHEMA}"."{t}" SET (autovacuum_enabled = false)')
+    conn.commit()
+
+    try:
+        yield
+    finally:
+        conn.rollback()
+        with conn.cursor() as cur:
+            for t in tables:
+                cur.execute(f'ALTER TABLE "{SCHEMA}"."{t}" RESET (autovacuum_enabled)')
+            cur.execute("ANALYZE " + ", ".join(f'"{SCHEMA}"."{t}"' for t in tables))
+        conn.commit()
+
+
+@contextmanager
+def unlogged_tables(conn, tables: list[str]):
+    """
+    Switch `tables` to UNLOGGED for a bulk load, then back to LOGGED on exit.
+
+    COPY into an unlogged table writes no per-row WAL; SET LOGGED then writes each table
+    to WAL in one sequential pass. Only used when the tables start out empty (see
+    LOAD_ORDERS_UNLOGGED): the switch rewrites the table, and a crash truncates unlogged
+    tables. Must run inside suspended_indexes, since a permanent table cannot keep an FK
+    to an unlogged one.
+    """
+    with conn.cursor() as cur:
+        for t in tables:
+            cur.execute(f'ALTER TABLE "{SCHEMA}"."{t}" SET UNLOGGED')
+    conn.commit()
+
+    try:
+        yield
+    finally:
+        conn.rollback()
+        with conn.cursor() as cur:
+            for t in tables:
+                cur.execute(f'ALTER TABLE "{SCHEMA}"."{t}" SET LOGGED')
+        conn.commit()
+
+
+@contextmanager
+def suspended_indexes(conn, tables: list[str]):
+    """
+    Drop secondary indexes and FK/CHECK constraints on `tables` for a bulk load, then
+    recreate them from their original definitions on exit.
+
+    Implementation notes:
+    - Definitions are captured with pg_get_indexdef / pg_get_constraintdef and written to
+      SUSPENDED_DDL_FILE before the drop is committed, so they survive a crash or a lost
+      connection.
+    - Primary key / unique constraints (and their indexes) stay in place; FKs elsewhere
+      reference them.
+    - The drop is committed before yielding so that other connections (see
+      loader_connections) can COPY into the tables without waiting on its locks; the
+      loaded rows are therefore committed before they are validated.
+    - On exit every restore statement runs in its own transaction, so one failure doesn't
+      undo the others. FK/CHECK constraints are added NOT VALID (enforced for new rows
+      from then on) and validated in a separate step, which checks the loaded rows in
+      one pass per constraint instead of per-row during COPY.
+    - If any statement fails, the file is rewritten with just the failed statements and
+      a RuntimeError reports them.
+    """
+    if os.path.exists(SUSPENDED_DDL_FILE):
+        raise RuntimeError(
+            f"{SUSPENDED_DDL_FILE} exists: a previous load did not restore its indexes / "
+            "constraints. Apply it with psql and remove it before loading again."
+        )
+
+    with conn.cursor(row_factory=dict_row) as cur:
+        cur.execute(
+            """
+            SELECT i.relname AS index_name, pg_get_indexdef(ix.indexrelid) AS ddl
+            FROM pg_index ix
+            JOIN pg_class t ON t.oid = ix.indrelid
+            JOIN pg_class i ON i.oid = ix.indexrelid
+            JOIN pg_namespace n ON n.oid = t.relnamespace
+            WHERE n.nspname = %s
+              AND t.relname = ANY(%s)
+              AND NOT EXISTS (
+                SELECT 1
+                FROM pg_constraint k
+                WHERE k.conindid = ix.indexrelid
+                  AND k.conrelid = ix.indrelid
+                  AND k.contype IN ('p', 'u', 'x')
+              )
+            ORDER BY t.relname, i.relname
+            """,
+            (SCHEMA, tables),
+        )
+        indexes = cur.fetchall()
+
+        cur.execute(
+            """
+            SELECT t.relname AS table_name, k.conname AS constraint_name,
+                   pg_get_constraintdef(k.oid) AS ddl, k.convalidated AS validated
+            FROM pg_constraint k
+            JOIN pg_class t ON t.oid = k.conrelid
+            JOIN pg_namespace n ON n.oid = t.relnamespace
+            WHERE n.nspname = %s
+              AND t.relname = ANY(%s)
+              AND k.contype IN ('f', 'c')
+            ORDER BY t.relname, k.conname
+            """,
+            (SCHEMA, tables),
+        )
+        constraints = cur.fetchall()
+
+        # Indexes first (FK validation can use them), then every constraint NOT VALID, then
+        # the validations. Constraints that were NOT VALID originally stay unvalidated
+        # (their pg_get_constraintdef already ends in NOT VALID).
+        restore = [f"{ix['ddl']};" for ix in indexes]
+        for c in constraints:
+            not_valid = "" if not c["validated"] else " NOT VALID"
+            restore.append(
+                f'ALTER TABLE "{SCHEMA}"."{c["table_name"]}" ADD CONSTRAINT "{c["constraint_name"]}" {c["ddl"]}{not_valid};'
+            )
+        for c in constraints:
+            if c["validated"]:
+                restore.append(
+                    f'ALTER TABLE "{SCHEMA}"."{c["table_name"]}" VALIDATE CONSTRAINT "{c["constraint_name"]}";'
+                )
+
+        with open(SUSPENDED_DDL_FILE, "w") as f:
+            f.write("\n".join(restore) + "\n")
+
+        for c in constraints:
+            cur.execute(f'ALTER TABLE "{SCHEMA}"."{c["table_name"]}" DROP CONSTRAINT "{c["constraint_name"]}"')
+        for ix in indexes:
+            cur.execute(f'DROP INDEX "{SCHEMA}"."{ix["index_name"]}"')
+    conn.commit()
+
+    try:
+        yield
+    finally:
+        conn.rollback()
+        failed = []
+        for stmt in restore:
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(stmt)
+                conn.commit()
+            except psycopg.Error as e:
+                conn.rollback()
+                failed.append((stmt, e))
+
+        if failed:
+            with open(SUSPENDED_DDL_FILE, "w") as f:
+                f.write("\n".join(stmt for stmt, _ in failed) + "\n")
+            details = "\n".join(f"  {stmt}\n    -> {e}" for stmt, e in failed)
+            raise RuntimeError(
+                f"{len(failed)} index/constraint restore statement(s) failed (kept in {SUSPENDED_DDL_FILE}):\n{details}"
+            )
+        os.remove(SUSPENDED_DDL_FILE)
+
+
 def gen_customers(seed: int):
     """
     Generate customer rows with dummy phone numbers.
@@ -173,20 +734,21 @@ def gen_customers(seed: int):
     - "DUMMY-" + 10 digits (e.g., DUMMY-4930185720)
     - ~35% NULLs
     """
-    rng = random.Random(seed)
-    base_ts = utc_now() - timedelta(days=365 * 2)
+    rng = np.random.default_rng(seed)
+    base_s = int((utc_now() - timedelta(days=365 * 2)).timestamp())
+
+    ids = np.arange(1, N_CUSTOMERS + 1).astype(str)
+    full_names = np.char.add("Customer ", ids)
+    emails = np.char.add(np.char.add("customer", ids), "@example.com")
 
-    for i in range(N_CUSTOMERS):
-        created_at = base_ts + timedelta(minutes=rng.randint(0, 365 * 2 * 24 * 60))
-        full_name = f"Customer {i+1}"
-        email = f"customer{i+1}@example.com"
+    minutes = rng.integers(0, 365 * 2 * 24 * 60, N_CUSTOMERS, endpoint=True)
+    created_at = to_datetimes(base_s + minutes * 60)
 
-        if rng.random() < 0.65:
-            phone = "DUMMY-" + "".join(str(rng.randint(0, 9)) for _ in range(10))
-        else:
-            phone = None
+    has_phone = rng.random(N_CUSTOMERS) < 0.65
+    digits = np.char.zfill(rng.integers(0, 10**10, N_CUSTOMERS).astype(str), 10)
+    phones = np.where(has_phone, np.char.add("DUMMY-", digits).astype(object), None)
 
-        yield (full_name, email, phone, created_at)
+    yield from zip(full_names.tolist(), emails.tolist(), phones.tolist(), created_at)
 
 
 def gen_customer_addresses(seed: int, customer_id_start: int, customer_id_end: int):
@@ -198,76 +760,79 @@ def gen_customer_addresses(seed: int, customer_id_start: int, customer_id_end: i
     - at most one default address per customer (matches partial unique index)
     - geo/country fields are consistent with a simple AU/IN simulation
     """
-    rng = random.Random(seed + 1000)
-    addr_base_ts = utc_now() - timedelta(days=365 * 2)
+    rng = np.random.default_rng(seed + 1000)
+    base_s = int((utc_now() - timedelta(days=365 * 2)).timestamp())
 
     # Dummy (non-real) city/state codes, but country remains real for currency mapping.
-    AU_CITY_CODES = [f"AU_CITY_{i:03d}" for i in range(1, 51)]
-    AU_STATE_CODES = [f"AU_STATE_{i:02d}" for i in range(1, 11)]
-
-    IN_CITY_CODES = [f"IN_CITY_{i:03d}" for i in range(1, 51)]
-    IN_STATE_CODES = [f"IN_STATE_{i:02d}" for i in range(1, 11)]
-
-    LABELS = ["HOME", "WORK", "OTHER"]
-
-    for customer_id in range(customer_id_start, customer_id_end + 1):
-        r = rng.random()
-        if r < 0.70:
-            n_addr = 1
-        elif r < 0.95:
-            n_addr = 2
-        else:
-            n_addr = 3
-
-        # Choose country once per customer to keep things coherent.
-        is_au = rng.random() < 0.55
-        country = "Australia" if is_au else "India"
-
-        if is_au:
-            city_pool = AU_CITY_CODES
-            state_pool = AU_STATE_CODES
-            # Dummy-but-AU-shaped postal codes
-            postal_code_fn = lambda: f"{rng.randint(1000, 9999)}"
-        else:
-            city_pool = IN_CITY_CODES
-            state_pool = IN_STATE_CODES
-            # Dummy-but-IN-shaped postal codes
-            postal_code_fn = lambda: f"{rng.randint(100000, 999999)}"
-
-        default_idx = rng.randrange(n_addr)
-
-        for j in range(n_addr):
-            city = rng.choice(city_pool)
-            state = rng.choice(state_pool)
-            label = rng.choice(LABELS)
-
-            # Dummy address lines (clearly not real-world)
-            line_1 = f"ADDR_{customer_id:05d}_{j+1:02d}"
-            line_2 = f"UNIT_{rng.randint(1, 999):03d}" if rng.random() < 0.25 else None
-
-            postal_code = postal_code_fn()
-
-            # Dummy coordinates (not meaningful / not tied to real geography)
-            lat = qround(rng.uniform(-10.0, 10.0), 6)
-            lon = qround(rng.uniform(-10.0, 10.0), 6)
-
-            is_default = (j == default_idx)
-            created_at = addr_base_ts + timedelta(minutes=rng.randint(0, 365 * 2 * 24 * 60))
-
-            yield (
-                customer_id,
-                label,
-                line_1,
-                line_2,
-                city,
-                state,
-                country,
-                postal_code,
-                lat,
-                lon,
-                is_default,
-                created_at,
-            )
+    AU_CITY_CODES = np.array([f"AU_CITY_{i:03d}" for i in range(1, 51)], dtype=object)
+    AU_STATE_CODES = np.array([f"AU_STATE_{i:02d}" for i in range(1, 11)], dtype=object)
+
+    IN_CITY_CODES = np.array([f"IN_CITY_{i:03d}" for i in range(1, 51)], dtype=object)
+    IN_STATE_CODES = np.array([f"IN_STATE_{i:02d}" for i in range(1, 11)], dtype=object)
+
+    LABELS = np.array(["HOME", "WORK", "OTHER"], dtype=object)
+
+    # Per-customer draws: address count, country (chosen once to keep things coherent)
+    # and which address is the default.
+    customer_ids = np.arange(customer_id_start, customer_id_end + 1)
+    n_customers = len(customer_ids)
+    n_addr = rng.choice([1, 2, 3], n_customers, p=[0.70, 0.25, 0.05])
+    cust_is_au = rng.random(n_customers) < 0.55
+    default_idx = rng.integers(0, n_addr)
+
+    # Expand to one entry per address; j is the address number within its customer.
+    cust_idx = np.repeat(np.arange(n_customers), n_addr)
+    n = len(cust_idx)
+    j = np.arange(n) - np.repeat(np.cumsum(n_addr) - n_addr, n_addr)
+    is_au = cust_is_au[cust_idx]
+
+    city_idx = rng.integers(0, len(AU_CITY_CODES), n)
+    state_idx = rng.integers(0, len(AU_STATE_CODES), n)
+    city = np.where(is_au, AU_CITY_CODES[city_idx], IN_CITY_CODES[city_idx])
+    state = np.where(is_au, AU_STATE_CODES[state_idx], IN_STATE_CODES[state_idx])
+    country = np.where(is_au, "Australia", "India")
+    label = LABELS[rng.integers(0, len(LABELS), n)]
+
+    # Dummy address lines (clearly not real-world)
+    line_1 = np.char.add(
+        np.char.add(np.char.add("ADDR_", np.char.zfill(customer_ids[cust_idx].astype(str), 5)), "_"),
+        np.char.zfill((j + 1).astype(str), 2),
+    )
+    line_2 = np.where(
+        rng.random(n) < 0.25,
+        np.char.add("UNIT_", np.char.zfill(rng.integers(1, 999, n, endpoint=True).astype(str), 3)).astype(object),
+        None,
+    )
+
+    # Dummy-but-AU/IN-shaped postal codes
+    postal_code = np.where(
+        is_au,
+        rng.integers(1000, 9999, n, endpoint=True),
+        rng.integers(100000, 999999, n, endpoint=True),
+    ).astype(str)
+
+    # Dummy coordinates (not meaningful / not tied to real geography)
+    lat = np.round(rng.uniform(-10.0, 10.0, n), 6)
+    lon = np.round(rng.uniform(-10.0, 10.0, n), 6)
+
+    is_default = j == default_idx[cust_idx]
+    minutes = rng.integers(0, 365 * 2 * 24 * 60, n, endpoint=True)
+    created_at = to_datetimes(base_s + minutes * 60)
+
+    yield from zip(
+        customer_ids[cust_idx].tolist(),
+        label.tolist(),
+        line_1.tolist(),
+        line_2.tolist(),
+        city.tolist(),
+        state.tolist(),
+        country.tolist(),
+        postal_code.tolist(),
+        lat.tolist(),
+        lon.tolist(),
+        is_default.tolist(),
+        created_at,
+    )
 
 
 def gen_brands(seed: int):
@@ -277,14 +842,15 @@ def gen_brands(seed: int):
     Returns tuples matching:
     (brand_name, is_active, created_at)
     """
-    rng = random.Random(seed + 2000)
-    base_ts = utc_now() - timedelta(days=365 * 3)
+    rng = np.random.default_rng(seed + 2000)
+    base_s = int((utc_now() - timedelta(days=365 * 3)).timestamp())
+
+    days = rng.integers(0, 365 * 3, N_BRANDS, endpoint=True)
+    created_at = to_datetimes(base_s + days * 86400)
+    names = np.char.add("Brand ", np.arange(1, N_BRANDS + 1).astype(str))
+    is_active = rng.random(N_BRANDS) < 0.97
 
-    for i in range(N_BRANDS):
-        created_at = base_ts + timedelta(days=rng.randint(0, 365 * 3))
-        name = f"Brand {i+1}"
-        is_active = True if rng.random() < 0.97 else False
-        yield (name, is_active, created_at)
+    yield from zip(names.tolist(), is_active.tolist(), created_at)
 
 
 def gen_outlets(seed: int, brand_id_start: int, brand_id_end: int):
@@ -294,32 +860,56 @@ def gen_outlets(seed: int, brand_id_start: int, brand_id_end: int):
     This aligns with the Postgres constraint:
       constraint uq_brand_outlet unique (brand_id, outlet_name, city, delivery_zone)
     """
-    rng = random.Random(seed + 3000)
-    base_ts = utc_now() - timedelta(days=365 * 3)
-
-    used_keys = set()
-
-    for _ in range(N_OUTLETS):
-        brand_id = rng.randint(brand_id_start, brand_id_end)
-        is_au = rng.random() < 0.55
-        city, _, _country = rng.choice(AU_CITIES if is_au else IN_CITIES)
-        delivery_zone = f"Z{rng.randint(1, 25)}"
-
-        outlet_name = f"Outlet {rng.randint(1, 50_000)}"
-        address_line1 = f"{rng.randint(1, 999)} Main Rd"
-        postal_code = str(rng.randint(2000, 7999)) if is_au else str(rng.randint(100000, 999999))
-
-        is_active = True if rng.random() < 0.98 else False
-        created_at = base_ts + timedelta(days=rng.randint(0, 365 * 3))
-
-        # Resolve rare collisions by regenerating the outlet_name until unique.
-        key = (brand_id, outlet_name, city, delivery_zone)
-        while key in used_keys:
-            outlet_name = f"Outlet {rng.randint(1, 50_000)}"
-            key = (brand_id, outlet_name, city, delivery_zone)
-        used_keys.add(key)
-
-        yield (brand_id, outlet_name, city, delivery_zone, address_line1, postal_code, is_active, created_at)
+    rng = np.random.default_rng(seed + 3000)
+    base_s = int((utc_now() - timedelta(days=365 * 3)).timestamp())
+
+    brand_ids = rng.integers(brand_id_start, brand_id_end, N_OUTLETS, endpoint=True)
+    is_au = rng.random(N_OUTLETS) < 0.55
+    city_idx = rng.integers(0, len(AU_CITIES), N_OUTLETS)
+    cities = np.where(
+        is_au,
+        np.array([c[0] for c in AU_CITIES])[city_idx],
+        np.array([c[0] for c in IN_CITIES])[city_idx],
+    )
+    zone_nums = rng.integers(1, 25, N_OUTLETS, endpoint=True)
+
+    outlet_nums = rng.integers(1, 50_000, N_OUTLETS, endpoint=True)
+    address_line1 = np.char.add(rng.integers(1, 999, N_OUTLETS, endpoint=True).astype(str), " Main Rd")
+    postal_codes = np.where(
+        is_au,
+        rng.integers(2000, 7999, N_OUTLETS, endpoint=True),
+        rng.integers(100000, 999999, N_OUTLETS, endpoint=True),
+    ).astype(str)
+
+    is_active = rng.random(N_OUTLETS) < 0.98
+    days = rng.integers(0, 365 * 3, N_OUTLETS, endpoint=True)
+    created_at = to_datetimes(base_s + days * 86400)
+
+    # Resolve rare collisions by resampling the outlet number of every repeated
+    # (brand, outlet, city, zone) key until all keys are unique.
+    city_codes = np.where(is_au, 0, len(AU_CITIES)) + city_idx
+    while True:
+        keys = np.stack([brand_ids, outlet_nums, city_codes, zone_nums], axis=1)
+        _, first_idx = np.unique(keys, axis=0, return_index=True)
+        dup = np.ones(N_OUTLETS, dtype=bool)
+        dup[first_idx] = False
+        if not dup.any():
+            break
+        outlet_nums[dup] = rng.integers(1, 50_000, int(dup.sum()), endpoint=True)
+
+    outlet_names = np.char.add("Outlet ", outlet_nums.astype(str))
+    zones = np.char.add("Z", zone_nums.astype(str))
+
+    yield from zip(
+        brand_ids.tolist(),
+        outlet_names.tolist(),
+        cities.tolist(),
+        zones.tolist(),
+        address_line1.tolist(),
+        postal_codes.tolist(),
+        is_active.tolist(),
+        created_at,
+    )
 
 
 def gen_menu_items(seed: int, restaurant_id_start: int, restaurant_id_end: int):
@@ -329,17 +919,33 @@ def gen_menu_items(seed: int, restaurant_id_start: int, restaurant_id_end: int):
     Returns tuples matching:
     (restaurant_id, item_name, category, price, is_available, created_at)
     """
-    rng = random.Random(seed + 4000)
-    base_ts = utc_now() - timedelta(days=365 * 2)
+    rng = np.random.default_rng(seed + 4000)
+    base_s = int((utc_now() - timedelta(days=365 * 2)).timestamp())
 
-    for restaurant_id in range(restaurant_id_start, restaurant_id_end + 1):
-        for j in range(MENU_ITEMS_PER_OUTLET):
-            item_name = f"Item {restaurant_id}-{j+1}"
-            category = rng.choice(CATEGORIES)
-            price = qround(rng.uniform(3.5, 32.0), 2)
-            is_available = True if rng.random() < 0.95 else False
-            created_at = base_ts + timedelta(days=rng.randint(0, 365 * 2))
-            yield (restaurant_id, item_name, category, price, is_available, created_at)
+    n_outlets = restaurant_id_end - restaurant_id_start + 1
+    n = n_outlets * MENU_ITEMS_PER_OUTLET
+
+    restaurant_ids = np.repeat(np.arange(restaurant_id_start, restaurant_id_end + 1), MENU_ITEMS_PER_OUTLET)
+    item_nums = np.tile(np.arange(1, MENU_ITEMS_PER_OUTLET + 1), n_outlets)
+    item_names = np.char.add(
+        np.char.add(np.char.add("Item ", restaurant_ids.astype(str)), "-"),
+        item_nums.astype(str),
+    )
+
+    categories = CATEGORY_VALUES[rng.integers(0, len(CATEGORY_VALUES), n)]
+    prices = np.round(rng.uniform(3.5, 32.0, n) + 1e-12, 2)
+    is_available = rng.random(n) < 0.95
+    days = rng.integers(0, 365 * 2, n, endpoint=True)
+    created_at = to_datetimes(base_s + days * 86400)
+
+    yield from zip(
+        restaurant_ids.tolist(),
+        item_names.tolist(),
+        categories.tolist(),
+        prices.tolist(),
+        is_available.tolist(),
+        created_at,
+    )
 
 
 def gen_couriers(seed: int):
@@ -349,16 +955,16 @@ def gen_couriers(seed: int):
     Returns tuples matching:
     (city, vehicle, is_active, created_at)
     """
-    rng = random.Random(seed + 5000)
-    base_ts = utc_now() - timedelta(days=365 * 2)
+    rng = np.random.default_rng(seed + 5000)
+    base_s = int((utc_now() - timedelta(days=365 * 2)).timestamp())
+
+    city = COURIER_CITY_VALUES[rng.integers(0, len(COURIER_CITY_VALUES), N_COURIERS)]
+    vehicle = VEHICLE_VALUES[rng.integers(0, len(VEHICLE_VALUES), N_COURIERS)]
+    is_active = rng.random(N_COURIERS) < 0.97
+    days = rng.integers(0, 365 * 2, N_COURIERS, endpoint=True)
+    created_at = to_datetimes(base_s + days * 86400)
 
-    cities = [c[0] for c in AU_CITIES] + [c[0] for c in IN_CITIES]
-    for _ in range(N_COURIERS):
-        city = rng.choice(cities)
-        vehicle = rng.choice(VEHICLES)
-        is_active = True if rng.random() < 0.97 else False
-        created_at = base_ts + timedelta(days=rng.randint(0, 365 * 2))
-        yield (city, vehicle, is_active, created_at)
+    yield from zip(city.tolist(), vehicle.tolist(), is_active.tolist(), created_at)
 
 
 def insert_currencies_and_fx(conn, seed: int):
@@ -372,28 +978,17 @@ def insert_currencies_and_fx(conn, seed: int):
     - Uses COPY to load fx_rates efficiently.
     """
     with conn.cursor(row_factory=dict_row) as cur:
+        # One round trip: DO UPDATE (a no-op assignment) makes RETURNING yield ids for
+        # rows that already existed too, without touching their other columns.
         cur.execute(
-            f'SELECT currency_id, currency_code FROM "{SCHEMA}".currencies WHERE currency_code IN (%s,%s)',
-            ("AUD", "INR"),
+            f'INSERT INTO "{SCHEMA}".currencies (currency_code, currency_name, is_active) '
+            f'VALUES (%s,%s,%s), (%s,%s,%s) '
+            f'ON CONFLICT (currency_code) DO UPDATE SET currency_code = EXCLUDED.currency_code '
+            f'RETURNING currency_id, currency_code',
+            ("AUD", "Australian Dollar", True, "INR", "Indian Rupee", True),
         )
         existing = {r["currency_code"]: r["currency_id"] for r in cur.fetchall()}
 
-        if "AUD" not in existing:
-            cur.execute(
-                f'INSERT INTO "{SCHEMA}".currencies (currency_code, currency_name, is_active) '
-                f'VALUES (%s,%s,%s) RETURNING currency_id',
-                ("AUD", "Australian Dollar", True),
-            )
-            existing["AUD"] = cur.fetchone()["currency_id"]
-
-        if "INR" not in existing:
-            cur.execute(
-                f'INSERT INTO "{SCHEMA}".currencies (currency_code, currency_name, is_active) '
-                f'VALUES (%s,%s,%s) RETURNING currency_id',
-                ("INR", "Indian Rupee", True),
-            )
-            existing["INR"] = cur.fetchone()["currency_id"]
-
         aud_id = existing["AUD"]
         inr_id = existing["INR"]
 
@@ -401,178 +996,442 @@ def insert_currencies_and_fx(conn, seed: int):
         end = utc_now().replace(hour=0, minute=0, second=0, microsecond=0)
         start = end - timedelta(days=FX_DAYS)
 
-        rows = []
-        rng = random.Random(seed)
+        rng = np.random.default_rng(seed)
 
         # Start from a plausible AUD->INR baseline and apply small daily drift.
-        rate = 55.0
-        for d in range(FX_DAYS):
-            ts = start + timedelta(days=d)
-
-            # Daily change is small to keep rates within a reasonable band.
-            rate *= (1.0 + rng.uniform(-0.002, 0.002))
-            aud_to_inr = qround(rate, 6)
-            inr_to_aud = qround(1.0 / rate, 8)
+        # Daily change is small to keep rates within a reasonable band.
+        rate = 55.0 * np.cumprod(1.0 + rng.uniform(-0.002, 0.002, FX_DAYS))
+        aud_to_inr = np.round(rate + 1e-12, 6)
+        inr_to_aud = np.round(1.0 / rate + 1e-12, 8)
+        rate_ts = to_datetimes(int(start.timestamp()) + np.arange(FX_DAYS) * 86400)
 
-            rows.append((aud_id, inr_id, ts, aud_to_inr, "SIMULATED"))
-            rows.append((inr_id, aud_id, ts, inr_to_aud, "SIMULATED"))
+        rows = []
+        for ts, fwd, inv in zip(rate_ts, aud_to_inr.tolist(), inr_to_aud.tolist()):
+            rows.append((aud_id, inr_id, ts, fwd, "SIMULATED"))
+            rows.append((inr_id, aud_id, ts, inv, "SIMULATED"))
 
-        copy_rows(conn, "fx_rates", ["base_currency_id", "quote_currency_id", "rate_ts", "rate", "source"], rows)
+        copy_rows(conn, "fx_rates", rows)
 
         return aud_id, inr_id
 
 
+def load_id_ranges(conn, id_columns: list[tuple[str, str]]) -> dict:
+    """
+    Load min/max ID ranges for (table, id column) pairs as {table: {"lo", "hi"}}.
+
+    One round trip: each min/max pair is read in the same statement, tagged by table.
+    """
+    sql = " UNION ALL ".join(
+        f"SELECT '{table}' AS tbl, min({col}) AS lo, max({col}) AS hi FROM \"{SCHEMA}\".{table}"
+        for table, col in id_columns
+    )
+
+    with conn.cursor(row_factory=tuple_row) as cur:
+        cur.execute(sql)
+        return {tbl: {"lo": lo, "hi": hi} for tbl, lo, hi in cur.fetchall()}
+
+
 def load_reference_ids(conn):
     """
     Load min/max ID ranges for key tables.
 
     These ranges are used to generate realistic foreign key values when creating orders.
     """
-    with conn.cursor(row_factory=dict_row) as cur:
-        cur.execute(f'SELECT min(customer_id) AS lo, max(customer_id) AS hi FROM "{SCHEMA}".customers')
-        cust = cur.fetchone()
+    id_columns = [
+        ("customers", "customer_id"),
+        ("restaurant_brands", "brand_id"),
+        ("restaurant_outlets", "restaurant_id"),
+        ("menu_items", "menu_item_id"),
+        ("couriers", "courier_id"),
+    ]
+    ranges = load_id_ranges(conn, id_columns)
 
-        cur.execute(f'SELECT min(brand_id) AS lo, max(brand_id) AS hi FROM "{SCHEMA}".restaurant_brands')
-        brand = cur.fetchone()
+    cust, brand, outlet, menu, courier = (ranges[table] for table, _ in id_columns)
+    return cust, brand, outlet, menu, courier
 
-        cur.execute(f'SELECT min(restaurant_id) AS lo, max(restaurant_id) AS hi FROM "{SCHEMA}".restaurant_outlets')
-        outlet = cur.fetchone()
 
-        cur.execute(f'SELECT min(menu_item_id) AS lo, max(menu_item_id) AS hi FROM "{SCHEMA}".menu_items')
-        menu = cur.fetchone()
+def _load_customer_tables(conn, seed: int) -> dict:
+    """
+    Load customers, then their addresses (which need the new customer id range).
 
-        cur.execute(f'SELECT min(courier_id) AS lo, max(courier_id) AS hi FROM "{SCHEMA}".couriers')
-        courier = cur.fetchone()
+    Returns the BRONZE_DIRECT tables (see copy_dimension_rows).
+    """
+    bronze = copy_dimension_rows(conn, "customers", gen_customers(seed=seed + 1))
 
-    return cust, brand, outlet, menu, courier
+    # Customer id range drives address generation.
+    cust_rng = load_id_ranges(conn, [("customers", "customer_id")])["customers"]
+
+    copy_rows(
+        conn,
+        "customer_addresses",
+        gen_customer_addresses(seed=seed + 2, customer_id_start=cust_rng["lo"], customer_id_end=cust_rng["hi"]),
+    )
+    return bronze
+
+
+def _load_restaurant_tables(conn, seed: int) -> dict:
+    """
+    Load brands -> outlets -> menu items, each driven by the previous table's id range.
+
+    Returns the BRONZE_DIRECT tables (see copy_dimension_rows).
+    """
+    bronze = copy_dimension_rows(conn, "restaurant_brands", gen_brands(seed=seed + 3))
+    brand_rng = load_id_ranges(conn, [("restaurant_brands", "brand_id")])["restaurant_brands"]
+
+    copy_rows(
+        conn,
+        "restaurant_outlets",
+        gen_outlets(seed=seed + 4, brand_id_start=brand_rng["lo"], brand_id_end=brand_rng["hi"]),
+    )
+    outlet_rng = load_id_ranges(conn, [("restaurant_outlets", "restaurant_id")])["restaurant_outlets"]
+
+    copy_rows(
+        conn,
+        "menu_items",
+        gen_menu_items(seed=seed + 5, restaurant_id_start=outlet_rng["lo"], restaurant_id_end=outlet_rng["hi"]),
+    )
+    return bronze
 
 
-def build_address_lookup(conn):
+def _load_courier_tables(conn, seed: int) -> dict:
     """
-    Build a mapping: customer_id -> list[(address_id, city, country)].
+    Load couriers and return the BRONZE_DIRECT tables (see copy_dimension_rows).
+    """
+    return copy_dimension_rows(conn, "couriers", gen_couriers(seed=seed + 6))
+
+
+def populate_reference_tables(seed: int):
+    """
+    Load the reference (dimension) tables and return (aud_id, inr_id).
+
+    Tables only depend on each other within a chain (customers -> addresses,
+    brands -> outlets -> menu items), so the four chains run concurrently, each on its
+    own loader connection: a child table must be loaded on its parent's connection, where
+    the uncommitted parent rows are visible to its FK checks. Chains commit only once all
+    of them have succeeded (see loader_connections).
+
+    BRONZE_DIRECT Parquet files are written only after every loader has committed, so
+    they never hold rows that were rolled back.
+    """
+    chains = {
+        "customers": _load_customer_tables,
+        "restaurants": _load_restaurant_tables,
+        "couriers": _load_courier_tables,
+        "currencies": lambda conn, seed: insert_currencies_and_fx(conn, seed=seed + 7),
+    }
+    with loader_connections(list(chains)) as loaders, ThreadPoolExecutor(max_workers=len(chains)) as pool:
+        futures = {name: pool.submit(load, loaders[name], seed) for name, load in chains.items()}
+        results = {name: fut.result() for name, fut in futures.items()}
+
+    for name in ("customers", "restaurants", "couriers"):
+        for table, data in results[name].items():
+            write_bronze_parquet(table, data)
+
+    return results["currencies"]
+
+
+def build_address_lookup(conn, cust_lo: int, cust_hi: int):
+    """
+    Build a CSR-style address lookup for customer ids [cust_lo, cust_hi].
+
+    Returns (offsets, addr_ids, country_is_au) as NumPy arrays:
+    - addresses of customer c are addr_ids[offsets[c - cust_lo]:offsets[c - cust_lo + 1]]
+    - country_is_au[j] flags whether addr_ids[j] is an Australian address
 
     This enables:
-    - choosing a valid delivery_address_id for each order
+    - choosing a valid delivery_address_id for a whole batch of orders with array ops
     - deriving currency_id from the address country in a consistent way
     """
-    with conn.cursor(row_factory=dict_row) as cur:
+    # Tuple rows: one per address, so skip building a dict for each.
+    with conn.cursor(row_factory=tuple_row) as cur:
         cur.execute(
             f"""
-            SELECT address_id, customer_id, city, country
+            SELECT address_id, customer_id, country
             FROM "{SCHEMA}".customer_addresses
+            WHERE customer_id BETWEEN %s AND %s
             ORDER BY customer_id, address_id
-            """
+            """,
+            (cust_lo, cust_hi),
         )
-        m = {}
-        for r in cur.fetchall():
-            m.setdefault(r["customer_id"], []).append((r["address_id"], r["city"], r["country"]))
-        return m
+        rows = cur.fetchall()
 
+    customer_idx = np.array([customer_id for _, customer_id, _ in rows], dtype=np.int64) - cust_lo
+    addr_ids = np.array([address_id for address_id, _, _ in rows], dtype=np.int64)
+    country_is_au = np.array([country == "Australia" for _, _, country in rows], dtype=bool)
 
-def build_order_timeline_delivered(rng, placed_at: datetime, now: datetime):
-    """
-    Build a monotonic order lifecycle for a delivered order.
+    offsets = np.zeros(cust_hi - cust_lo + 2, dtype=np.int64)
+    np.cumsum(np.bincount(customer_idx, minlength=cust_hi - cust_lo + 1), out=offsets[1:])
+
+    return offsets, addr_ids, country_is_au
 
-    Output includes:
-    - events: ordered list of (event_ts, status, actor)
-    - assigned_at / pickup_eta / dropoff_eta
-    - delivered_ts
 
+def _enforce_monotonic(stages: np.ndarray, latest_s: int) -> np.ndarray:
     """
-    placed_ts = placed_at
+    Clamp and order a (n_stages, n_orders) matrix of epoch seconds in place.
 
-    accepted_ts = placed_ts + timedelta(minutes=rng.randint(1, 6))
-    prep_start_ts = accepted_ts + timedelta(minutes=rng.randint(2, 10))
-    ready_ts = prep_start_ts + timedelta(minutes=rng.randint(5, 20))
+    - Prevent generating timestamps in the future relative to "now": every stage after
+      the first is clamped to latest_s.
+    - Enforce strictly increasing timestamps to avoid failing ordering tests: a stage
+      that does not follow its predecessor moves to predecessor + 1 minute (clamped).
+    """
+    np.minimum(stages[1:], latest_s, out=stages[1:])
+    for k in range(1, len(stages)):
+        prev = stages[k - 1]
+        stages[k] = np.where(stages[k] <= prev, np.minimum(prev + 60, latest_s), stages[k])
+    return stages
 
-    assigned_at = ready_ts + timedelta(minutes=rng.randint(1, 8))
-    pickup_eta = assigned_at + timedelta(minutes=rng.randint(10, 25))
-    picked_up_ts = pickup_eta + timedelta(minutes=rng.randint(-3, 3))
 
-    dropoff_eta = pickup_eta + timedelta(minutes=rng.randint(10, 35))
-    delivered_ts = dropoff_eta + timedelta(minutes=rng.randint(-3, 3))
+def build_order_timelines_delivered(rng, placed_s: np.ndarray, latest_s: int) -> dict:
+    """
+    Build monotonic order lifecycles for delivered orders.
 
-    # Prevent generating timestamps in the future relative to "now".
-    latest_allowed = now - timedelta(minutes=1)
+    All values are int64 epoch-second arrays aligned with placed_s. Output includes:
+    - event stages: placed, accepted, prep_start, ready, picked_up, delivered
+    - assigned_at / pickup_eta / dropoff_eta
+    """
+    n = len(placed_s)
+
+    def minutes(lo: int, hi: int) -> np.ndarray:
+        return rng.integers(lo, hi, n, endpoint=True) * 60
+
+    accepted = placed_s + minutes(1, 6)
+    prep_start = accepted + minutes(2, 10)
+    ready = prep_start + minutes(5, 20)
+
+    assigned_at = ready + minutes(1, 8)
+    pickup_eta = assigned_at + minutes(10, 25)
+    picked_up = pickup_eta + minutes(-3, 3)
+
+    dropoff_eta = pickup_eta + minutes(10, 35)
+    delivered = dropoff_eta + minutes(-3, 3)
+
+    names = [
+        "placed",
+        "accepted",
+        "prep_start",
+        "ready",
+        "assigned_at",
+        "pickup_eta",
+        "picked_up",
+        "dropoff_eta",
+        "delivered",
+    ]
+    stages = np.stack(
+        [placed_s, accepted, prep_start, ready, assigned_at, pickup_eta, picked_up, dropoff_eta, delivered]
+    )
+    return dict(zip(names, _enforce_monotonic(stages, latest_s)))
 
-    def clamp(ts: datetime) -> datetime:
-        # Clamp any future timestamps back into an allowed window.
-        return ts if ts <= latest_allowed else latest_allowed
 
-    accepted_ts = clamp(accepted_ts)
-    prep_start_ts = clamp(prep_start_ts)
-    ready_ts = clamp(ready_ts)
+def build_order_timelines_canceled(rng, placed_s: np.ndarray, latest_s: int) -> dict:
+    """
+    Build minimal canceled lifecycles: PLACED -> CANCELED (int64 epoch-second arrays).
+    """
+    canceled = placed_s + rng.integers(2, 30, len(placed_s), endpoint=True) * 60
+    stages = _enforce_monotonic(np.stack([placed_s, canceled]), latest_s)
+    return {"placed": stages[0], "canceled": stages[1]}
 
-    assigned_at = clamp(assigned_at)
-    pickup_eta = clamp(pickup_eta)
-    picked_up_ts = clamp(picked_up_ts)
 
-    dropoff_eta = clamp(dropoff_eta)
-    delivered_ts = clamp(delivered_ts)
+def timeline_events(order_idx: np.ndarray, timeline: dict, spec: list[tuple[str, str, str]]):
+    """
+    Flatten per-order timelines into status events.
 
-    # Enforce strictly increasing timestamps to avoid failing ordering tests.
-    def ensure_after(ts: datetime, prev: datetime) -> datetime:
-        if ts <= prev:
-            return clamp(prev + timedelta(minutes=1))
-        return ts
+    `spec` lists (stage, status, actor) in lifecycle order. Returns aligned arrays
+    (order_idx, event_ts, status, actor) with each order's events kept together.
+    """
+    k = len(spec)
+    event_idx = np.repeat(order_idx, k)
+    event_ts = np.stack([timeline[stage] for stage, _, _ in spec], axis=1).ravel()
+    status = np.tile(np.array([st for _, st, _ in spec], dtype=object), len(order_idx))
+    actor = np.tile(np.array([ac for _, _, ac in spec], dtype=object), len(order_idx))
+    return event_idx, event_ts, status, actor
 
-    accepted_ts = ensure_after(accepted_ts, placed_ts)
-    prep_start_ts = ensure_after(prep_start_ts, accepted_ts)
-    ready_ts = ensure_after(ready_ts, prep_start_ts)
 
-    assigned_at = ensure_after(assigned_at, ready_ts)
-    pickup_eta = ensure_after(pickup_eta, assigned_at)
-    picked_up_ts = ensure_after(picked_up_ts, pickup_eta)
+# Per-process order generation context, set once per worker by _init_orders_worker.
+_orders_ctx = {}
 
-    dropoff_eta = ensure_after(dropoff_eta, picked_up_ts)
-    delivered_ts = ensure_after(delivered_ts, dropoff_eta)
 
-    events = [
-        (placed_ts, "PLACED", "CUSTOMER"),
-        (accepted_ts, "ACCEPTED", "RESTAURANT"),
-        (prep_start_ts, "PREP_START", "RESTAURANT"),
-        (ready_ts, "READY_FOR_PICKUP", "RESTAURANT"),
-        (picked_up_ts, "PICKED_UP", "COURIER"),
-        (delivered_ts, "DELIVERED", "SYSTEM"),
-    ]
+def _init_orders_worker(ctx: dict) -> None:
+    """
+    ProcessPoolExecutor initializer.
 
-    return {
-        "events": events,
-        "assigned_at": assigned_at,
-        "pickup_eta": pickup_eta,
-        "dropoff_eta": dropoff_eta,
-        "delivered_ts": delivered_ts,
-    }
+    Receives the shared order generation context (address lookup, id ranges, time
+    window) once per worker process instead of pickling it with every shard.
+    """
+    _orders_ctx.update(ctx)
 
 
-def build_order_timeline_canceled(rng, placed_at: datetime, now: datetime):
-    """
-    Build a minimal canceled lifecycle: PLACED -> CANCELED.
+def _gen_orders_chunk(seed: int, chunk_start: int, chunk_end: int):
     """
-    placed_ts = placed_at
-    canceled_ts = placed_ts + timedelta(minutes=rng.randint(2, 30))
+    Generate orders [chunk_start, chunk_end) of the run and their dependent rows.
 
-    latest_allowed = now - timedelta(minutes=1)
+    Each shard seeds its own RNGs from (seed, chunk_start), so the output does not
+    depend on how shards are scheduled across worker processes.
 
-    # Clamp cancel event to allowed window.
-    if canceled_ts > latest_allowed:
-        canceled_ts = latest_allowed
+    Order-level columns and lifecycles are sampled as arrays (timestamps as int64 epoch
+    seconds); tuples are only assembled for COPY.
+    Returns (orders, order_items, events, assignments, refunds, ratings) row lists.
+    """
+    ctx = _orders_ctx
+    rng = np.random.default_rng([seed, chunk_start])
+    n = chunk_end - chunk_start
+
+    order_ids = ctx["base_order_id"] + chunk_start + 1 + np.arange(n)
+    customer_ids = rng.integers(ctx["cust_lo"], ctx["cust_hi"], n, endpoint=True)
+    restaurant_ids = rng.integers(ctx["outlet_lo"], ctx["outlet_hi"], n, endpoint=True)
+    placed_s = ctx["start_s"] + rng.integers(0, ctx["window_s"], n, endpoint=True)
+
+    # Order items drive subtotal, which drives totals and check constraints.
+    n_items = rng.integers(1, 5, n, endpoint=True)
+    item_order_idx = np.repeat(np.arange(n), n_items)
+    n_total_items = len(item_order_idx)
+
+    menu_item_ids = rng.integers(ctx["menu_lo"], ctx["menu_hi"], n_total_items, endpoint=True)
+    qty = rng.integers(1, 3, n_total_items, endpoint=True)
+
+    # unit_price is the paid price (not necessarily current menu price).
+    unit_price = np.round(rng.uniform(5.0, 35.0, n_total_items) + 1e-12, 2)
+    line_total = np.round(qty * unit_price + 1e-12, 2)
+
+    subtotal = np.round(np.bincount(item_order_idx, weights=line_total, minlength=n) + 1e-12, 2)
+    tax = np.round(subtotal * rng.uniform(0.05, 0.12, n) + 1e-12, 2)
+    delivery_fee = np.round(rng.uniform(1.0, 8.0, n) + 1e-12, 2)
+
+    # Keep discount within a safe cap so expected totals do not become negative.
+    discount_cap = np.maximum(0.0, subtotal + tax + delivery_fee)
+    discount = np.round(np.minimum(discount_cap, rng.uniform(0.0, 1.0, n) * subtotal * 0.20) + 1e-12, 2)
+
+    # This must match the CHECK constraint logic on orders_total_consistency.
+    total_amount = np.round(subtotal + tax + delivery_fee - discount + 1e-12, 2)
+
+    payment_method = PAYMENT_METHOD_VALUES[rng.integers(0, len(PAYMENT_METHOD_VALUES), n)]
+    delivered = rng.random(n) < 0.92
+    courier_ids = rng.integers(ctx["courier_lo"], ctx["courier_hi"], n, endpoint=True)
+
+    # Delivered orders are PAID; canceled orders keep payment_status in non-final states.
+    payment_status = np.where(
+        delivered,
+        "PAID",
+        CANCELED_PAYMENT_STATUS_VALUES[rng.integers(0, len(CANCELED_PAYMENT_STATUS_VALUES), n)],
+    )
 
-    # Ensure canceled_ts is strictly after placed_ts.
-    if canceled_ts <= placed_ts:
-        canceled_ts = placed_ts + timedelta(minutes=1)
-        if canceled_ts > latest_allowed:
-            canceled_ts = latest_allowed
+    # Refund subset (refund_ts after delivery; refund_amount <= total_amount).
+    # Refund attributes are only drawn for the orders in the subset.
+    refund_idx = np.flatnonzero(delivered & (rng.random(n) < 0.035))
+    n_refunds = len(refund_idx)
+    refund_minutes = rng.integers(5, 180, n_refunds, endpoint=True)
+    refund_amount = np.round(total_amount[refund_idx] * rng.uniform(0.05, 0.80, n_refunds) + 1e-12, 2)
+    refund_reason = REFUND_REASON_VALUES[rng.integers(0, len(REFUND_REASON_VALUES), n_refunds)]
+    payment_status[refund_idx[rng.random(n_refunds) < 0.75]] = "REFUNDED"
+
+    # Ratings subset
+    rated_idx = np.flatnonzero(delivered & (rng.random(n) < 0.55))
+    n_ratings = len(rated_idx)
+    rating_minutes = rng.integers(2, 240, n_ratings, endpoint=True)
+    restaurant_rating = rng.integers(1, 5, n_ratings, endpoint=True)
+    courier_rating = np.where(
+        rng.random(n_ratings) < 0.85,
+        rng.integers(1, 5, n_ratings, endpoint=True).astype(object),
+        None,
+    )
+    comment = np.where(rng.random(n_ratings) < 0.75, None, "Tasty and fast delivery.")
+
+    # The delivery address drives both delivery_address_id and currency_id.
+    # AU addresses map to AUD, everything else maps to INR for this dataset.
+    offsets, addr_ids, country_is_au = ctx["address_lookup"]
+    cust_idx = customer_ids - ctx["cust_lo"]
+    first_addr = offsets[cust_idx]
+    addr_idx = first_addr + rng.integers(0, offsets[cust_idx + 1] - first_addr)
+    address_ids = addr_ids[addr_idx].tolist()
+    currency_ids = np.where(country_is_au[addr_idx], ctx["aud_id"], ctx["inr_id"])
+
+    orders_rows = list(
+        zip(
+            order_ids.tolist(),
+            customer_ids.tolist(),
+            address_ids,
+            restaurant_ids.tolist(),
+            placed_s.tolist(),
+            [None] * n,  # scheduled_delivery
+            subtotal.tolist(),
+            tax.tolist(),
+            delivery_fee.tolist(),
+            discount.tolist(),
+            total_amount.tolist(),
+            payment_method.tolist(),
+            payment_status.tolist(),
+            currency_ids.tolist(),
+        )
+    )
+    order_items_rows = list(
+        zip(
+            order_ids[item_order_idx].tolist(),
+            menu_item_ids.tolist(),
+            qty.tolist(),
+            unit_price.tolist(),
+            line_total.tolist(),
+        )
+    )
 
-    events = [
-        (placed_ts, "PLACED", "CUSTOMER"),
-        (canceled_ts, "CANCELED", "SYSTEM"),
-    ]
+    # Lifecycles, clamped to one minute before "now".
+    latest_s = int(ctx["now"].timestamp()) - 60
+    delivered_idx = np.flatnonzero(delivered)
+    canceled_idx = np.flatnonzero(~delivered)
+    dl = build_order_timelines_delivered(rng, placed_s[delivered_idx], latest_s)
+    cl = build_order_timelines_canceled(rng, placed_s[canceled_idx], latest_s)
+
+    # Remaining status events, grouped per order in order_id order.
+    ev_idx, ev_ts, ev_status, ev_actor = (
+        np.concatenate(parts)
+        for parts in zip(
+            timeline_events(delivered_idx, dl, DELIVERED_EVENTS),
+            timeline_events(canceled_idx, cl, CANCELED_EVENTS),
+        )
+    )
+    ev_order = np.argsort(ev_idx, kind="stable")
+    events_rows = list(
+        zip(
+            order_ids[ev_idx[ev_order]].tolist(),
+            ev_ts[ev_order].tolist(),
+            ev_status[ev_order].tolist(),
+            ev_actor[ev_order].tolist(),
+            [None] * len(ev_idx),  # notes
+        )
+    )
+    assignments_rows = list(
+        zip(
+            order_ids[delivered_idx].tolist(),
+            courier_ids[delivered_idx].tolist(),
+            dl["assigned_at"].tolist(),
+            dl["pickup_eta"].tolist(),
+            dl["dropoff_eta"].tolist(),
+        )
+    )
 
-    return {
-        "events": events,
-        "canceled_ts": canceled_ts,
-    }
+    # Refunds and ratings follow delivery.
+    delivered_s = np.zeros(n, dtype=np.int64)
+    delivered_s[delivered_idx] = dl["delivered"]
+
+    refunds_rows = list(
+        zip(
+            order_ids[refund_idx].tolist(),
+            (delivered_s[refund_idx] + refund_minutes * 60).tolist(),
+            refund_reason.tolist(),
+            refund_amount.tolist(),
+            currency_ids[refund_idx].tolist(),
+        )
+    )
+    ratings_rows = list(
+        zip(
+            order_ids[rated_idx].tolist(),
+            customer_ids[rated_idx].tolist(),
+            restaurant_rating.tolist(),
+            courier_rating.tolist(),
+            comment.tolist(),
+            (delivered_s[rated_idx] + rating_minutes * 60).tolist(),
+        )
+    )
+
+    return orders_rows, order_items_rows, events_rows, assignments_rows, refunds_rows, ratings_rows
 
 
 def populate_orders_related(
@@ -599,21 +1458,10 @@ def populate_orders_related(
     - Totals are generated to satisfy the orders_total_consistency CHECK constraint.
     - Status event sequences are generated to satisfy downstream dbt ordering tests.
     - currency_id is derived from delivery address country for consistent reporting.
+    - Shards of CHUNK_ROWS orders are generated in ORDER_WORKERS processes and streamed
+      into one open COPY per table (one loader connection each).
     """
-    rng = random.Random(seed)
-    address_map = build_address_lookup(conn)
-
-    cust_lo, cust_hi = cust_range["lo"], cust_range["hi"]
-    outlet_lo, outlet_hi = outlet_range["lo"], outlet_range["hi"]
-    menu_lo, menu_hi = menu_range["lo"], menu_range["hi"]
-    courier_lo, courier_hi = courier_range["lo"], courier_range["hi"]
-
-    orders_rows = []
-    order_items_rows = []
-    events_rows = []
-    assignments_rows = []
-    refunds_rows = []
-    ratings_rows = []
+    address_lookup = build_address_lookup(conn, cust_range["lo"], cust_range["hi"])
 
     now = utc_now()
     start_ts = now - timedelta(days=ORDERS_DAYS)
@@ -622,293 +1470,93 @@ def populate_orders_related(
     if end_ts <= start_ts:
         raise ValueError("Invalid time window: end_ts must be > start_ts.")
 
-    def currency_for_country(country: str) -> int:
-        # AU addresses map to AUD, everything else maps to INR for this dataset.
-        return aud_id if country == "Australia" else inr_id
-
-    # A temp staging table allows bulk loading with stable explicit order_id values.
-    with conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TEMP TABLE IF NOT EXISTS _stg_orders (
-              order_id bigint,
-              customer_id bigint,
-              delivery_address_id bigint,
-              restaurant_id bigint,
-              order_placed_at timestamptz,
-              scheduled_delivery timestamptz,
-              subtotal numeric(12,2),
-              tax numeric(12,2),
-              delivery_fee numeric(12,2),
-              discount numeric(12,2),
-              total_amount numeric(12,2),
-              payment_method {SCHEMA}.payment_method,
-              payment_status {SCHEMA}.payment_status,
-              currency_id bigint
-            ) ON COMMIT PRESERVE ROWS;
-            """
-        )
-        cur.execute("TRUNCATE _stg_orders;")
-        cur.execute(f'SELECT COALESCE(MAX(order_id), 0) AS mx FROM "{SCHEMA}".orders')
-        base_order_id = cur.fetchone()["mx"]
-
-    for i in range(N_ORDERS):
-        order_id = base_order_id + i + 1
-
-        customer_id = rng.randint(cust_lo, cust_hi)
-        address_id, _addr_city, addr_country = rng.choice(address_map[customer_id])
-
-        restaurant_id = rng.randint(outlet_lo, outlet_hi)
-
-        placed_at = start_ts + timedelta(seconds=rng.randint(0, int((end_ts - start_ts).total_seconds())))
-        scheduled_delivery = None
-
-        # Order items drive subtotal, which drives totals and check constraints.
-        n_items = rng.randint(1, 5)
-        items = []
-        subtotal = 0.0
-
-        for _ in range(n_items):
-            menu_item_id = rng.randint(menu_lo, menu_hi)
-            qty = rng.randint(1, 3)
-
-            # unit_price is the paid price (not necessarily current menu price).
-            unit_price = qround(rng.uniform(5.0, 35.0), 2)
-            line_total = qround(qty * unit_price, 2)
-
-            subtotal += line_total
-            items.append((menu_item_id, qty, unit_price, line_total))
-
-        subtotal = qround(subtotal, 2)
-        tax = qround(subtotal * rng.uniform(0.05, 0.12), 2)
-        delivery_fee = qround(rng.uniform(1.0, 8.0), 2)
-
-        # Keep discount within a safe cap so expected totals do not become negative.
-        discount_cap = max(0.0, subtotal + tax + delivery_fee)
-        discount = qround(min(discount_cap, rng.uniform(0.0, subtotal * 0.20)), 2)
-
-        # This must match the CHECK constraint logic on orders_total_consistency.
-        total_amount = qround(subtotal + tax + delivery_fee - discount, 2)
-
-        payment_method = rng.choice(PAYMENT_METHODS)
-
-        delivered = rng.random() < 0.92
-
-        if delivered:
-            payment_status = "PAID"
-            timeline = build_order_timeline_delivered(rng, placed_at, now)
-
-            courier_id = rng.randint(courier_lo, courier_hi)
-            assignments_rows.append(
-                (order_id, courier_id, timeline["assigned_at"], timeline["pickup_eta"], timeline["dropoff_eta"])
-            )
-
-            for (menu_item_id, qty, unit_price, line_total) in items:
-                order_items_rows.append((order_id, menu_item_id, qty, unit_price, line_total))
-
-            for (ts, status, actor) in timeline["events"]:
-                events_rows.append((order_id, ts, status, actor, None))
-
-            # Refund subset (ensures refund_ts after delivery; ensures refund_amount <= total_amount).
-            if rng.random() < 0.035:
-                refund_ts = timeline["delivered_ts"] + timedelta(minutes=rng.randint(5, 180))
-                refund_amount = qround(total_amount * rng.uniform(0.05, 0.80), 2)
-                refund_reason = rng.choice(REFUND_REASONS)
-                currency_id = currency_for_country(addr_country)
-
-                refunds_rows.append((order_id, refund_ts, refund_reason, refund_amount, currency_id))
-                if rng.random() < 0.75:
-                    payment_status = "REFUNDED"
-
-            # Ratings subset
-            if rng.random() < 0.55:
-                rating_created = timeline["delivered_ts"] + timedelta(minutes=rng.randint(2, 240))
-                restaurant_rating = rng.randint(1, 5)
-                courier_rating = rng.randint(1, 5) if rng.random() < 0.85 else None
-                comment = None if rng.random() < 0.75 else "Tasty and fast delivery."
-                ratings_rows.append((order_id, customer_id, restaurant_rating, courier_rating, comment, rating_created))
-
-        else:
-            # Canceled lifecycle; payment_status kept in non-final states.
-            payment_status = rng.choice(["FAILED", "PENDING"])
-            timeline = build_order_timeline_canceled(rng, placed_at, now)
-
-            for (menu_item_id, qty, unit_price, line_total) in items:
-                order_items_rows.append((order_id, menu_item_id, qty, unit_price, line_total))
-
-            for (ts, status, actor) in timeline["events"]:
-                events_rows.append((order_id, ts, status, actor, None))
-
-        currency_id = currency_for_country(addr_country)
-
-        orders_rows.append(
-            (
-                order_id,
-                customer_id,
-                address_id,
-                restaurant_id,
-                placed_at,
-                scheduled_delivery,
-                subtotal,
-                tax,
-                delivery_fee,
-                discount,
-                total_amount,
-                payment_method,
-                payment_status,
-                currency_id,
-            )
-        )
-
-        # Batch flush to bound memory and keep transactions manageable.
-        if len(orders_rows) >= CHUNK_ROWS:
-            _flush_orders_batch(conn, orders_rows, order_items_rows, events_rows, assignments_rows, refunds_rows, ratings_rows)
-            orders_rows.clear()
-            order_items_rows.clear()
-            events_rows.clear()
-            assignments_rows.clear()
-            refunds_rows.clear()
-            ratings_rows.clear()
-
-    if orders_rows:
-        _flush_orders_batch(conn, orders_rows, order_items_rows, events_rows, assignments_rows, refunds_rows, ratings_rows)
-
-
-def _flush_orders_batch(conn, orders_rows, order_items_rows, events_rows, assignments_rows, refunds_rows, ratings_rows):
-    """
-    Flush a batch of orders and their dependent rows using COPY.
-
-    Steps:
-    1) COPY orders into temp _stg_orders
-    2) INSERT into oltp.orders
-    3) COPY child tables
-    4) Align sequences with max values to avoid future collisions
-    """
-    copy_rows(
-        conn,
-        "_stg_orders",
-        [
-            "order_id",
-            "customer_id",
-            "delivery_address_id",
-            "restaurant_id",
-            "order_placed_at",
-            "scheduled_delivery",
-            "subtotal",
-            "tax",
-            "delivery_fee",
-            "discount",
-            "total_amount",
-            "payment_method",
-            "payment_status",
-            "currency_id",
-        ],
-        orders_rows,
-        schema_qualify=False,
-    )
+    # order_id is assigned client-side from a monotonic counter, so rows can be COPY'd
+    # straight into oltp.orders without colliding with existing ids.
+    with conn.cursor(row_factory=scalar_row) as cur:
+        cur.execute(f'SELECT COALESCE(MAX(order_id), 0) FROM "{SCHEMA}".orders')
+        base_order_id = cur.fetchone()
+
+    ctx = {
+        "address_lookup": address_lookup,
+        "cust_lo": cust_range["lo"],
+        "cust_hi": cust_range["hi"],
+        "outlet_lo": outlet_range["lo"],
+        "outlet_hi": outlet_range["hi"],
+        "menu_lo": menu_range["lo"],
+        "menu_hi": menu_range["hi"],
+        "courier_lo": courier_range["lo"],
+        "courier_hi": courier_range["hi"],
+        "aud_id": aud_id,
+        "inr_id": inr_id,
+        "now": now,
+        "start_s": int(start_ts.timestamp()),
+        "window_s": int((end_ts - start_ts).total_seconds()),
+        "base_order_id": base_order_id,
+    }
 
-    with conn.cursor() as cur:
-        cur.execute(
-            f"""
-            INSERT INTO "{SCHEMA}".orders (
-              order_id,
-              customer_id,
-              delivery_address_id,
-              restaurant_id,
-              order_placed_at,
-              scheduled_delivery,
-              subtotal,
-              tax,
-              delivery_fee,
-              discount,
-              total_amount,
-              payment_method,
-              payment_status,
-              currency_id
+    workers = ORDER_WORKERS or os.cpu_count() or 1
+    shard_starts = iter(range(0, N_ORDERS, CHUNK_ROWS))
+
+    with loader_connections(ORDER_TABLES) as loaders:
+        with ExitStack() as stack:
+            # One COPY per table stays open for the whole phase. Each writes through a
+            # QueuedLibpqWriter thread, so the six backends ingest concurrently while
+            # this thread serializes rows.
+            streams = []
+            for table in ORDER_TABLES:
+                cur = stack.enter_context(loaders[table].cursor())
+                streams.append(stack.enter_context(copy_stream(cur, table, writer=QueuedLibpqWriter(cur))))
+
+            pool = stack.enter_context(
+                ProcessPoolExecutor(max_workers=workers, initializer=_init_orders_worker, initargs=(ctx,))
             )
-            SELECT
-              order_id,
-              customer_id,
-              delivery_address_id,
-              restaurant_id,
-              order_placed_at,
-              scheduled_delivery,
-              subtotal,
-              tax,
-              delivery_fee,
-              discount,
-              total_amount,
-              payment_method,
-              payment_status,
-              currency_id
-            FROM _stg_orders
-            ON CONFLICT (order_id) DO NOTHING;
-            """
-        )
-        cur.execute("TRUNCATE _stg_orders;")
-
-    if order_items_rows:
-        copy_rows(
-            conn,
-            "order_items",
-            ["order_id", "menu_item_id", "quantity", "unit_price", "line_total"],
-            order_items_rows,
-        )
-
-    if events_rows:
-        copy_rows(
-            conn,
-            "order_status_events",
-            ["order_id", "event_ts", "status", "actor", "notes"],
-            events_rows,
-        )
-
-    if assignments_rows:
-        copy_rows(
-            conn,
-            "delivery_assignments",
-            ["order_id", "courier_id", "assigned_at", "pickup_eta", "dropoff_eta"],
-            assignments_rows,
-        )
 
-    if refunds_rows:
-        copy_rows(
-            conn,
-            "refunds",
-            ["order_id", "refund_ts", "refund_reason", "refund_amount", "currency_id"],
-            refunds_rows,
-        )
-
-    if ratings_rows:
-        copy_rows(
-            conn,
-            "ratings",
-            ["order_id", "customer_id", "restaurant_rating", "courier_rating", "comment", "created_at"],
-            ratings_rows,
+            def submit_next(pending):
+                chunk_start = next(shard_starts, None)
+                if chunk_start is not None:
+                    end = min(chunk_start + CHUNK_ROWS, N_ORDERS)
+                    pending.append(pool.submit(_gen_orders_chunk, seed, chunk_start, end))
+
+            # Keep a bounded window of shards in flight and write them in shard order;
+            # later shards keep generating while earlier ones stream into COPY.
+            pending = deque()
+            for _ in range(2 * workers):
+                submit_next(pending)
+            while pending:
+                shard = pending.popleft().result()
+                submit_next(pending)
+                for cp, rows in zip(streams, shard):
+                    for row in rows:
+                        cp.write_row(row)
+                del shard
+
+        # PLACED events are exactly (order_id, order_placed_at, CUSTOMER). Derive them on
+        # the orders connection, which sees its uncommitted rows, instead of shipping them.
+        loaders["orders"].execute(
+            f'INSERT INTO "{SCHEMA}".order_status_events (order_id, event_ts, status, actor) '
+            f"SELECT order_id, order_placed_at, 'PLACED', 'CUSTOMER' FROM \"{SCHEMA}\".orders WHERE order_id > %s",
+            (base_order_id,),
         )
 
     # Keep sequences aligned to prevent collisions if later inserts omit explicit IDs.
-    with conn.cursor() as cur:
-        cur.execute(
-            f"SELECT setval(pg_get_serial_sequence('{SCHEMA}.orders','order_id'), "
-            f"(SELECT COALESCE(MAX(order_id),1) FROM {SCHEMA}.orders))"
-        )
-        cur.execute(
-            f"SELECT setval(pg_get_serial_sequence('{SCHEMA}.order_items','order_item_id'), "
-            f"(SELECT COALESCE(MAX(order_item_id),1) FROM {SCHEMA}.order_items))"
-        )
-        cur.execute(
-            f"SELECT setval(pg_get_serial_sequence('{SCHEMA}.order_status_events','event_id'), "
-            f"(SELECT COALESCE(MAX(event_id),1) FROM {SCHEMA}.order_status_events))"
-        )
-        cur.execute(
-            f"SELECT setval(pg_get_serial_sequence('{SCHEMA}.refunds','refund_id'), "
-            f"(SELECT COALESCE(MAX(refund_id),1) FROM {SCHEMA}.refunds))"
-        )
-        cur.execute(
-            f"SELECT setval(pg_get_serial_sequence('{SCHEMA}.ratings','rating_id'), "
-            f"(SELECT COALESCE(MAX(rating_id),1) FROM {SCHEMA}.ratings))"
+    # All five sequences are realigned by a single statement (one round trip), composed
+    # with quoted identifiers / literals rather than string interpolation.
+    serial_columns = [
+        ("orders", "order_id"),
+        ("order_items", "order_item_id"),
+        ("order_status_events", "event_id"),
+        ("refunds", "refund_id"),
+        ("ratings", "rating_id"),
+    ]
+    setvals = SQL(", ").join(
+        SQL("setval(pg_get_serial_sequence({}, {}), (SELECT COALESCE(MAX({}), 1) FROM {}))").format(
+            Literal(f'"{SCHEMA}"."{table}"'), Literal(col), Identifier(col), Identifier(SCHEMA, table)
         )
+        for table, col in serial_columns
+    )
+    with conn.cursor() as cur:
+        cur.execute(SQL("SELECT {}").format(setvals))
+    conn.commit()
 
 
 def main():
@@ -919,7 +1567,10 @@ def main():
     The resulting OLTP dataset is then used in the downstream pipeline:
     Postgres -> DuckDB Parquet bronze -> DuckDB raw views -> dbt staging/intermediate/marts.
     """
-    with psycopg.connect(dsn, autocommit=False, row_factory=dict_row) as conn:
+    if BRONZE_DIRECT and not RESET_DB_BEFORE_LOAD:
+        raise ValueError("BRONZE_DIRECT needs RESET_DB_BEFORE_LOAD (ids must restart at 1).")
+
+    with pg_connect(autocommit=False, row_factory=dict_row) as conn:
         with conn.cursor() as cur:
             # Ensure all unqualified table names resolve to the OLTP schema.
             cur.execute(f'SET search_path TO "{SCHEMA}", public;')
@@ -928,90 +1579,30 @@ def main():
             reset_tables(conn)
             conn.commit()
 
-        # Customers
-        copy_rows(conn, "customers", ["full_name", "email", "phone", "created_at"], gen_customers(seed=SEED + 1))
-        conn.commit()
-
-        # Customer id range drives address generation.
-        with conn.cursor(row_factory=dict_row) as cur:
-            cur.execute(f'SELECT min(customer_id) AS lo, max(customer_id) AS hi FROM "{SCHEMA}".customers')
-            cust_rng = cur.fetchone()
-
-        # Customer addresses
-        copy_rows(
-            conn,
-            "customer_addresses",
-            [
-                "customer_id",
-                "label",
-                "line_1",
-                "line_2",
-                "city",
-                "state",
-                "country",
-                "postal_code",
-                "latitude",
-                "longitude",
-                "is_default",
-                "created_at",
-            ],
-            gen_customer_addresses(seed=SEED + 2, customer_id_start=cust_rng["lo"], customer_id_end=cust_rng["hi"]),
-        )
-        conn.commit()
-
-        # Brands
-        copy_rows(conn, "restaurant_brands", ["brand_name", "is_active", "created_at"], gen_brands(seed=SEED + 3))
-        conn.commit()
-
-        with conn.cursor(row_factory=dict_row) as cur:
-            cur.execute(f'SELECT min(brand_id) AS lo, max(brand_id) AS hi FROM "{SCHEMA}".restaurant_brands')
-            brand_rng = cur.fetchone()
-
-        # Outlets
-        copy_rows(
-            conn,
-            "restaurant_outlets",
-            ["brand_id", "outlet_name", "city", "delivery_zone", "address_line1", "postal_code", "is_active", "created_at"],
-            gen_outlets(seed=SEED + 4, brand_id_start=brand_rng["lo"], brand_id_end=brand_rng["hi"]),
-        )
-        conn.commit()
-
-        with conn.cursor(row_factory=dict_row) as cur:
-            cur.execute(f'SELECT min(restaurant_id) AS lo, max(restaurant_id) AS hi FROM "{SCHEMA}".restaurant_outlets')
-            outlet_rng = cur.fetchone()
-
-        # Menu items
-        copy_rows(
-            conn,
-            "menu_items",
-            ["restaurant_id", "item_name", "category", "price", "is_available", "created_at"],
-            gen_menu_items(seed=SEED + 5, restaurant_id_start=outlet_rng["lo"], restaurant_id_end=outlet_rng["hi"]),
-        )
-        conn.commit()
-
-        # Couriers
-        copy_rows(conn, "couriers", ["city", "vehicle", "is_active", "created_at"], gen_couriers(seed=SEED + 6))
-        conn.commit()
-
-        # Currencies + FX rates
-        aud_id, inr_id = insert_currencies_and_fx(conn, seed=SEED + 7)
-        conn.commit()
-
-        # Load ID ranges for order generation.
-        cust_rng, _brand_rng, outlet_rng, menu_rng, courier_rng = load_reference_ids(conn)
-
-        # Orders and dependent tables
-        populate_orders_related(
-            conn,
-            seed=SEED,
-            cust_range=cust_rng,
-            outlet_range=outlet_rng,
-            menu_range=menu_rng,
-            courier_range=courier_rng,
-            aud_id=aud_id,
-            inr_id=inr_id,
-        )
-        conn.commit()
+        # Autovacuum stays off until every table is loaded, then all are analyzed once.
+        with autovacuum_suspended(conn, LOAD_TABLES):
+            # Reference data (customers, restaurants, couriers, currencies/FX).
+            aud_id, inr_id = populate_reference_tables(seed=SEED)
+
+            # Load ID ranges for order generation.
+            cust_rng, _brand_rng, outlet_rng, menu_rng, courier_rng = load_reference_ids(conn)
+
+            # Orders and dependent tables, loaded without secondary indexes / FK / CHECK overhead
+            # (and without WAL when they start out empty).
+            with ExitStack() as stack:
+                stack.enter_context(suspended_indexes(conn, ORDER_TABLES))
+                if RESET_DB_BEFORE_LOAD and LOAD_ORDERS_UNLOGGED:
+                    stack.enter_context(unlogged_tables(conn, ORDER_TABLES))
+                populate_orders_related(
+                    conn,
+                    seed=SEED,
+                    cust_range=cust_rng,
+                    outlet_range=outlet_rng,
+                    menu_range=menu_rng,
+                    courier_range=courier_rng,
+                    aud_id=aud_id,
+                    inr_id=inr_id,
+                )
 
 
 if __name__ == "__main__":
@@ -1,6 +1,11 @@
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import duckdb
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from oltp.populate_oltp import BRONZE_DIRECT, BRONZE_DIRECT_TABLES
 
 out_path = Path("food_delivery_dbt/data/bronze")
 out_path.mkdir(parents=True, exist_ok=True)
@@ -10,19 +15,80 @@ pg_port = os.getenv("PG_PORT", "5432")
 pg_db = os.getenv("PG_DB", "food_delivery")
 pg_user = os.getenv("PG_USER", "")
 
+# Exports run concurrently, one DuckDB cursor (and Postgres scan) per table.
+# `threads` is a database-wide setting: all export cursors share one pool of
+# DUCKDB_THREADS worker threads, so it is sized to the machine rather than per export.
+EXPORT_WORKERS = 8
+DUCKDB_THREADS = os.cpu_count() or 1
+
+# Bronze Parquet layout: ZSTD for smaller files, and small row groups whose min/max
+# stats let readers skip row groups. Partitioned exports ORDER BY their timestamp so rows
+# are clustered by time within each partition (the parallel partitioned writer may
+# still emit a few sorted runs per file rather than one).
+# FILE_SIZE_BYTES / PER_THREAD_OUTPUT are not used: DuckDB rejects them with PARTITION_BY,
+# and non-partitioned tables must stay single files for create_raw_views.sql.
+PARQUET_OPTIONS = "FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE 16384"
+
+# Memory cap for DuckDB; sorts / partition buffers beyond it spill to DUCKDB_TEMP_DIR.
+DUCKDB_MEMORY_LIMIT = "8GB"
+DUCKDB_TEMP_DIR = "/tmp/duck_spill"
+
+# With BRONZE_DIRECT (set in oltp/populate_oltp.py), the loader already wrote these static
+# dimension tables to bronze Parquet, so they are not re-exported from Postgres; their
+# files must exist rather than silently leaving the downstream views without them.
+if BRONZE_DIRECT:
+    missing = [t for t in BRONZE_DIRECT_TABLES if not (out_path / f"{t}.parquet").exists()]
+    if missing:
+        raise FileNotFoundError(
+            f"BRONZE_DIRECT is set but {', '.join(missing)} not found in {out_path}; "
+            "run oltp/populate_oltp.py first."
+        )
+
+# When True, the non-partitioned tables are streamed from Postgres as Arrow record batches
+# over ADBC and written batch by batch with pyarrow, bypassing the DuckDB postgres scanner.
+# Partitioned exports still go through DuckDB (PARTITION_BY, ORDER BY, partition days).
+ADBC_EXPORT = False
+
 conn = duckdb.connect()
 conn.execute("INSTALL postgres;")
 conn.execute("LOAD postgres;")
+conn.execute(f"SET threads = {DUCKDB_THREADS};")
+# Exports without ORDER BY may be written in any order, so rows stream from the Postgres
+# scan into the Parquet writer; explicit ORDER BYs are still honoured.
+conn.execute("SET preserve_insertion_order = false;")
+conn.execute(f"SET memory_limit = '{DUCKDB_MEMORY_LIMIT}';")
+conn.execute(f"SET temp_directory = '{DUCKDB_TEMP_DIR}';")
+
+
+def utc_day(column: str) -> str:
+    """
+    SQL for the UTC calendar day of a TIMESTAMPTZ column (partition key).
+
+    Same result as CAST(timezone('UTC', column) AS DATE) under any session TimeZone, but
+    built from the epoch microseconds, so it skips the per-row ICU time zone conversion.
+    """
+    return f"CAST(make_timestamp(epoch_us({column})) AS DATE)"
 
-attach_parts = [f"host={pg_host}", f"port={pg_port}", f"dbname={pg_db}"]
+
+# statement_timeout is passed as a libpq startup option so it applies to every connection
+# the scanner (or ADBC) opens.
+conninfo_parts = [
+    f"host={pg_host}",
+    f"port={pg_port}",
+    f"dbname={pg_db}",
+    "options='-c statement_timeout=0'",
+]
 if pg_user:
-    attach_parts.append(f"user={pg_user}")
+    conninfo_parts.append(f"user={pg_user}")
+pg_conninfo = " ".join(conninfo_parts)
 
+# READ_ONLY: the export never writes to Postgres, so DuckDB only opens read transactions.
+# Quotes in the conninfo are doubled inside the SQL string literal.
 conn.execute(
     f"""
-    ATTACH '{' '.join(attach_parts)}'
+    ATTACH '{pg_conninfo.replace("'", "''")}'
     AS pg_data
-    (TYPE postgres);
+    (TYPE postgres, READ_ONLY);
     """
 )
 
@@ -38,89 +104,174 @@ non_partitioned_tables = [
     "currencies",
 ]
 
+# Each export is a list of (message printed once done, SQL statement) steps that run
+# in order on one cursor; separate exports run concurrently.
+exports = []
+
+# Tables exported through ADBC instead (see ADBC_EXPORT).
+adbc_exports = []
+
 for table_name in non_partitioned_tables:
+    if BRONZE_DIRECT and table_name in BRONZE_DIRECT_TABLES:
+        continue
+    if ADBC_EXPORT:
+        adbc_exports.append(table_name)
+        continue
     final_path = out_path / f"{table_name}.parquet"
-    conn.execute(
+    exports.append([(
+        f"Wrote {final_path}",
         f"""
         COPY (SELECT * FROM pg_data.oltp.{table_name})
         TO '{final_path.as_posix()}'
-        (FORMAT PARQUET);
-        """
-    )
-    print(f"Wrote {final_path}")
+        ({PARQUET_OPTIONS});
+        """,
+    )])
 
+# orders is read from Postgres once into a local table (with order_day computed) and
+# both the orders and order_items exports use it; the order_items join is then local.
+# Plain table, not TEMP: TEMP tables are private to the cursor that created them.
 orders_path = out_path / "orders"
 orders_path.mkdir(parents=True, exist_ok=True)
-conn.execute(f"""
-COPY(
-  SELECT
-    *,
-    CAST(timezone('UTC', order_placed_at) AS DATE) AS order_day
-  FROM pg_data.oltp.orders
-)
-TO '{orders_path.as_posix()}'
-(FORMAT PARQUET, PARTITION_BY (order_day));
-""")
-
-print("Wrote the partitioned orders....")
-
 order_items_path = out_path / "order_items"
 order_items_path.mkdir(parents=True, exist_ok=True)
-conn.execute(f"""
+exports.append([
+    ("Read orders from Postgres....", f"""
+CREATE OR REPLACE TABLE _orders AS
+SELECT
+  *,
+  {utc_day('order_placed_at')} AS order_day
+FROM pg_data.oltp.orders;
+"""),
+    ("Wrote the partitioned orders....", f"""
+COPY (SELECT * FROM _orders ORDER BY order_placed_at)
+TO '{orders_path.as_posix()}'
+({PARQUET_OPTIONS}, PARTITION_BY (order_day));
+"""),
+    ("Wrote partitioned order_items.....", f"""
 COPY (
   SELECT
     oi.*,
-    CAST(timezone('UTC', o.order_placed_at) AS DATE) AS order_day
+    o.order_day
   FROM pg_data.oltp.order_items oi
-  JOIN pg_data.oltp.orders o
+  JOIN _orders o
     ON o.order_id = oi.order_id
+  ORDER BY o.order_placed_at, oi.order_item_id
 )
 TO '{order_items_path.as_posix()}'
-(FORMAT PARQUET, PARTITION_BY (order_day));
-""")
-print("Wrote partitioned order_items.....")
-
+({PARQUET_OPTIONS}, PARTITION_BY (order_day));
+"""),
+    ("Dropped local orders....", "DROP TABLE _orders;"),
+])
 
 events_path = out_path / "order_status_events"
 events_path.mkdir(parents=True, exist_ok=True)
-conn.execute(f"""
+exports.append([("Wrote the partitioned order_status_events....", f"""
 COPY(
   SELECT
     *,
-    CAST(timezone('UTC', event_ts) AS DATE) AS event_day
+    {utc_day('event_ts')} AS event_day
   FROM pg_data.oltp.order_status_events
+  ORDER BY event_ts
 )
 TO '{events_path.as_posix()}'
-(FORMAT PARQUET, PARTITION_BY (event_day));
-""")
-print("Wrote the partitioned order_status_events....")
+({PARQUET_OPTIONS}, PARTITION_BY (event_day));
+""")])
 
 refunds_path = out_path / "refunds"
 refunds_path.mkdir(parents=True, exist_ok=True)
-conn.execute(f"""
+exports.append([("Wrote the partitioned refunds....", f"""
 COPY(
   SELECT
     *,
-    CAST(timezone('UTC', refund_ts) AS DATE) AS refund_day
+    {utc_day('refund_ts')} AS refund_day
   FROM pg_data.oltp.refunds
+  ORDER BY refund_ts
 )
 TO '{refunds_path.as_posix()}'
-(FORMAT PARQUET, PARTITION_BY (refund_day));
-""")
-print("Wrote the partitioned refunds....")
+({PARQUET_OPTIONS}, PARTITION_BY (refund_day));
+""")])
 
 fx_path = out_path / "fx_rates"
 fx_path.mkdir(parents=True, exist_ok=True)
-conn.execute(f"""
+exports.append([("Wrote the partitioned fx_rates....", f"""
 COPY(
   SELECT
     *,
-    CAST(timezone('UTC', rate_ts) AS DATE) AS rate_day
+    {utc_day('rate_ts')} AS rate_day
   FROM pg_data.oltp.fx_rates
+  ORDER BY rate_ts
 )
 TO '{fx_path.as_posix()}'
-(FORMAT PARQUET, PARTITION_BY (rate_day));
-""")
-print("Wrote the partitioned fx_rates....")
+({PARQUET_OPTIONS}, PARTITION_BY (rate_day));
+""")])
+
+
+def run_export(steps: list[tuple[str, str]]) -> None:
+    # DuckDB cursors are not thread-safe: each export gets its own.
+    cur = conn.cursor()
+    try:
+        for message, sql in steps:
+            cur.execute(sql)
+            print(message)
+    finally:
+        cur.close()
+
+
+def numeric_arrow_type(precision: int | None, scale: int | None) -> pa.DataType:
+    """
+    Arrow type for a Postgres NUMERIC column: DECIMAL(p, s) when the column declares a
+    precision Arrow can hold, otherwise the exact text the driver returns.
+    """
+    if precision is None:
+        return pa.string()
+    if precision <= 38:
+        return pa.decimal128(precision, scale)
+    if precision <= 76:
+        return pa.decimal256(precision, scale)
+    return pa.string()
+
+
+def run_adbc_export(table_name: str) -> None:
+    """
+    Stream one table from Postgres over ADBC into `<table>.parquet`.
+
+    The driver returns NUMERIC as strings, so those columns are cast to the DECIMAL(p, s)
+    the DuckDB scanner would produce, using the precision/scale from the catalog
+    (see numeric_arrow_type).
+    """
+    # Imported here: the driver is only needed when ADBC_EXPORT is on.
+    import adbc_driver_postgresql.dbapi as adbc_pg
+
+    final_path = out_path / f"{table_name}.parquet"
+    with adbc_pg.connect(pg_conninfo) as pg_conn, pg_conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT column_name, numeric_precision, numeric_scale
+            FROM information_schema.columns
+            WHERE table_schema = 'oltp' AND table_name = $1 AND data_type = 'numeric'
+            """,
+            (table_name,),
+        )
+        decimals = {name: numeric_arrow_type(p, s) for name, p, s in cur.fetchall()}
+
+        cur.execute(f"SELECT * FROM oltp.{table_name}")
+        reader = cur.fetch_record_batch()
+        schema = pa.schema([pa.field(f.name, decimals.get(f.name, f.type)) for f in reader.schema])
+
+        with pq.ParquetWriter(final_path, schema, compression="zstd") as writer:
+            for batch in reader:
+                columns = [
+                    col.storage.cast(decimals[name]) if name in decimals else col
+                    for name, col in zip(batch.schema.names, batch.columns)
+                ]
+                writer.write_batch(pa.RecordBatch.from_arrays(columns, schema=schema), row_group_size=16384)
+    print(f"Wrote {final_path}")
+
+
+with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as pool:
+    futures = [pool.submit(run_export, steps) for steps in exports]
+    futures += [pool.submit(run_adbc_export, table_name) for table_name in adbc_exports]
+    for fut in as_completed(futures):
+        fut.result()
 
-conn.close()
\ No newline at end of file
+conn.close()